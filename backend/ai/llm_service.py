@@ -6,10 +6,18 @@ Falls back to template-based generation if no LLM model is available.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import platform
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from config import settings
+from utils.email_templates import default_privacy_contact, get_takedown_email
 
 logger = logging.getLogger("kashf.ai.llm")
 
@@ -17,6 +25,119 @@ logger = logging.getLogger("kashf.ai.llm")
 _llm_instance = None
 _llm_loaded = False
 
+# Model loading and inference run on this single dedicated thread: llama.cpp
+# is not thread-safe, and blocking calls must stay off the event loop and out
+# of the default executor shared with the rest of the app.
+_llm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kashf-llm")
+
+# Static instructions come first so every request shares the same token
+# prefix — llama.cpp keeps the evaluated prefix in its KV cache and only
+# prefills the per-request details.
+_PROMPT_PREFIX = """<s>[INST] You are a legal compliance assistant specializing in data privacy.
+
+Generate a formal, professional GDPR Article 17 and CCPA §1798.105 data deletion request email.
+
+Requirements:
+1. Subject line should be clear and reference the regulation
+2. Body must cite GDPR Article 17 ("Right to Erasure") and CCPA §1798.105
+3. Request complete deletion of all personal data
+4. Request confirmation of deletion within 30 days
+5. Mention right to lodge complaint with supervisory authority if not complied
+6. Professional and firm but polite tone
+7. Include a deadline for response (30 days as per regulation)
+
+Format the response as:
+SUBJECT: [subject line]
+BODY:
+[full email body]
+RECIPIENT_HINT: [suggested email address or department, e.g., privacy@platform.com]
+END_OF_EMAIL
+
+"""
+
+# Section headers in the model output, e.g. "SUBJECT: …" (case-insensitive,
+# leading indentation allowed).
+_SECTION_RE = re.compile(
+    r"^[ \t]*(?P<kind>SUBJECT|BODY|RECIPIENT_HINT):[ \t]*(?P<rest>.*)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_PROMPT_DETAILS = """Details:
+- Platform: {platform}
+- Data Subject Name: {user_name}
+- Data Subject Email: {user_email}
+- Data found on platform:
+{findings}
+[/INST]"""
+
+# Generation halts as soon as the structured output is complete (or the
+# model starts a second draft) instead of running to max_tokens.
+_STOP_SEQUENCES = ["</s>", "[INST]", "END_OF_EMAIL", "\n\nSUBJECT:", "\n\n[End"]
+
+
+@lru_cache(maxsize=4)
+def check_model_quantization(model_path: str) -> bool:
+    """
+    Validate the GGUF file name against LLM_QUANTIZATION.
+
+    Logs a warning for unexpected quantizations. Returns False for BF16
+    models, which have no accelerated kernels and fall back to slow paths.
+    """
+    name = Path(model_path).name.upper()
+    if "BF16" in name:
+        logger.error(
+            f"BF16 GGUF models are not supported — use a {settings.LLM_QUANTIZATION} "
+            f"quantization instead: {model_path}"
+        )
+        return False
+
+    expected = f"{settings.LLM_QUANTIZATION}.GGUF".upper()
+    if not name.endswith(expected):
+        logger.warning(
+            f"LLM model is not a {settings.LLM_QUANTIZATION} GGUF ({model_path}) — "
+            f"inference may be slower and use more memory than expected"
+        )
+    return True
+
+
+def _llm_threads() -> int:
+    """Thread count for llama.cpp — physical cores unless overridden."""
+    if settings.LLM_N_THREADS > 0:
+        return settings.LLM_N_THREADS
+    # os.cpu_count() reports logical CPUs; halve it to skip SMT siblings,
+    # which contend for the same SIMD units.
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def _log_cpu_features() -> None:
+    """Log the SIMD extensions llama.cpp was compiled with."""
+    try:
+        import llama_cpp
+
+        info = llama_cpp.llama_print_system_info().decode("utf-8", errors="replace").strip()
+    except Exception as exc:
+        logger.debug(f"Could not read llama.cpp system info: {exc}")
+        return
+
+    logger.info(f"llama.cpp system info: {info}")
+    if platform.machine().lower() in ("x86_64", "amd64") and "AVX2 = 1" not in info:
+        logger.warning(
+            "llama-cpp-python was built without AVX2 — reinstall with "
+            'CMAKE_ARGS="-DGGML_AVX2=on -DGGML_AVX512=on -DGGML_FMA=on" for faster inference'
+        )
+
+
+# ggml tensor types accepted for the KV cache (llama.cpp's ggml_type enum).
+_KV_CACHE_TYPES = {"f16": 1, "q4_0": 2, "q8_0": 8}
+
+
+def _kv_cache_type() -> int:
+    kv_quant = settings.LLM_KV_QUANT.lower()
+    if kv_quant not in _KV_CACHE_TYPES:
+        logger.warning(f"Unknown LLM_KV_QUANT '{settings.LLM_KV_QUANT}' — using f16")
+        kv_quant = "f16"
+    return _KV_CACHE_TYPES[kv_quant]
+
 
 def _get_llm():
     """Lazy-load the LLM model. Returns None if not configured or load fails."""
@@ -31,17 +152,32 @@ def _get_llm():
         logger.info("No LLM_MODEL_PATH configured — using template-based email generation")
         return None
 
+    if not check_model_quantization(settings.LLM_MODEL_PATH):
+        logger.warning("Falling back to template-based email generation")
+        return None
+
     try:
         from llama_cpp import Llama
 
-        logger.info(f"Loading LLM model from: {settings.LLM_MODEL_PATH}")
+        n_threads = _llm_threads()
+        kv_type = _kv_cache_type()
+        logger.info(f"Loading LLM model from: {settings.LLM_MODEL_PATH} ({n_threads} threads)")
         _llm_instance = Llama(
             model_path=settings.LLM_MODEL_PATH,
             n_ctx=settings.LLM_CONTEXT_SIZE,
-            n_threads=4,
+            n_threads=n_threads,
+            n_batch=512,
+            use_mmap=True,  # page weights in from disk on demand
+            use_mlock=settings.LLM_MLOCK,
+            type_k=kv_type,
+            type_v=kv_type,
+            offload_kqv=True,
+            # llama.cpp only supports a quantized V cache with flash attention
+            flash_attn=kv_type != _KV_CACHE_TYPES["f16"],
             verbose=False,
         )
         logger.info("✅ LLM loaded successfully")
+        _log_cpu_features()
         return _llm_instance
     except ImportError:
         logger.warning("llama-cpp-python not installed — falling back to templates")
@@ -51,7 +187,82 @@ def _get_llm():
         return None
 
 
-def generate_takedown_email(
+class LLMScheduler:
+    """
+    Queues takedown prompts and drains them in batches on a worker thread.
+
+    llama.cpp keeps a single decode context, so requests must not run on the
+    model concurrently. Callers enqueue a prompt and await a future; one
+    background task collects whatever is queued (up to ``max_batch``) and
+    runs it in a single hop onto the LLM thread, keeping the event loop free.
+    """
+
+    def __init__(self, max_batch: int) -> None:
+        self._max_batch = max(1, max_batch)
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future[str]]] | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def submit(self, llm, prompt: str) -> str:
+        """Queue a prompt and wait for its completion text."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._drain(llm))
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, future))
+        return await future
+
+    async def stop(self) -> None:
+        """Cancel the worker task (called on app shutdown)."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    async def _drain(self, llm) -> None:
+        assert self._queue is not None
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                outputs = await asyncio.get_running_loop().run_in_executor(
+                    _llm_executor, _complete_batch, llm, [p for p, _ in batch]
+                )
+            except Exception as exc:
+                outputs = [exc] * len(batch)
+
+            for (_, future), output in zip(batch, outputs):
+                if future.done():
+                    continue  # caller went away
+                if isinstance(output, Exception):
+                    future.set_exception(output)
+                else:
+                    future.set_result(output)
+
+
+def _complete_batch(llm, prompts: list[str]) -> list[str | Exception]:
+    """Run queued prompts back to back on the model (worker thread)."""
+    outputs: list[str | Exception] = []
+    for prompt in prompts:
+        try:
+            output = llm(
+                prompt,
+                max_tokens=settings.LLM_MAX_TOKENS,
+                temperature=0.3,
+                top_p=0.9,
+                stop=_STOP_SEQUENCES,
+            )
+            outputs.append(output["choices"][0]["text"].strip())
+        except Exception as exc:
+            outputs.append(exc)
+    return outputs
+
+
+llm_scheduler = LLMScheduler(settings.LLM_MAX_BATCH)
+
+
+async def generate_takedown_email(
     platform: str,
     user_name: str,
     user_email: str,
@@ -65,17 +276,19 @@ def generate_takedown_email(
     Returns:
         dict with keys: email_subject, email_body, recipient_hint
     """
-    llm = _get_llm()
+    # First call loads the model (seconds) — do it on the LLM thread
+    llm = _llm_instance if _llm_loaded else await asyncio.get_running_loop().run_in_executor(
+        _llm_executor, _get_llm
+    )
 
     if llm is not None:
-        return _generate_with_llm(llm, platform, user_name, user_email, findings)
+        return await _generate_with_llm(llm, platform, user_name, user_email, findings)
 
     # Fallback to template
-    from utils.email_templates import get_takedown_email
     return get_takedown_email(platform, user_name, user_email, findings)
 
 
-def _generate_with_llm(
+async def _generate_with_llm(
     llm,
     platform: str,
     user_name: str,
@@ -87,46 +300,18 @@ def _generate_with_llm(
     if findings:
         findings_str = "\n".join(f"- {k}: {v}" for k, v in findings.items() if v)
 
-    prompt = f"""<s>[INST] You are a legal compliance assistant specializing in data privacy.
-
-Generate a formal, professional GDPR Article 17 and CCPA §1798.105 data deletion request email.
-
-Details:
-- Platform: {platform}
-- Data Subject Name: {user_name}
-- Data Subject Email: {user_email}
-- Data found on platform:
-{findings_str if findings_str else "  (General data presence detected)"}
-
-Requirements:
-1. Subject line should be clear and reference the regulation
-2. Body must cite GDPR Article 17 ("Right to Erasure") and CCPA §1798.105
-3. Request complete deletion of all personal data
-4. Request confirmation of deletion within 30 days
-5. Mention right to lodge complaint with supervisory authority if not complied
-6. Professional and firm but polite tone
-7. Include a deadline for response (30 days as per regulation)
-
-Format the response as:
-SUBJECT: [subject line]
-BODY:
-[full email body]
-RECIPIENT_HINT: [suggested email address or department, e.g., privacy@platform.com]
-[/INST]"""
+    prompt = _PROMPT_PREFIX + _PROMPT_DETAILS.format(
+        platform=platform,
+        user_name=user_name,
+        user_email=user_email,
+        findings=findings_str if findings_str else "  (General data presence detected)",
+    )
 
     try:
-        output = llm(
-            prompt,
-            max_tokens=settings.LLM_MAX_TOKENS,
-            temperature=0.3,
-            top_p=0.9,
-            stop=["</s>", "[INST]"],
-        )
-        response_text = output["choices"][0]["text"].strip()
+        response_text = await llm_scheduler.submit(llm, prompt)
         return _parse_llm_response(response_text, platform, user_name, user_email)
     except Exception as exc:
         logger.error(f"LLM generation failed: {exc} — falling back to template")
-        from utils.email_templates import get_takedown_email
         return get_takedown_email(platform, user_name, user_email, findings)
 
 
@@ -141,32 +326,26 @@ def _parse_llm_response(
     body = ""
     recipient = ""
 
-    lines = text.split("\n")
-    current_section = None
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.upper().startswith("SUBJECT:"):
-            subject = stripped[len("SUBJECT:"):].strip()
-            current_section = "subject"
-        elif stripped.upper().startswith("BODY:"):
-            body_start = stripped[len("BODY:"):].strip()
-            if body_start:
-                body = body_start + "\n"
-            current_section = "body"
-        elif stripped.upper().startswith("RECIPIENT_HINT:"):
-            recipient = stripped[len("RECIPIENT_HINT:"):].strip()
-            current_section = "recipient"
-        elif current_section == "body":
-            body += line + "\n"
+    sections = list(_SECTION_RE.finditer(text))
+    for i, match in enumerate(sections):
+        kind = match["kind"].upper()
+        rest = match["rest"].strip()
+        if kind == "SUBJECT":
+            subject = rest
+        elif kind == "RECIPIENT_HINT":
+            recipient = rest
+        else:
+            # Body runs from the header line up to the next section header
+            end = sections[i + 1].start() if i + 1 < len(sections) else len(text)
+            body = rest + text[match.end():end]
 
     # Fallback to template if parsing failed
     if not subject or not body:
-        from utils.email_templates import get_takedown_email
         return get_takedown_email(platform, user_name, user_email)
 
     return {
         "email_subject": subject,
         "email_body": body.strip(),
-        "recipient_hint": recipient or f"privacy@{platform.lower().replace(' ', '').replace('/', '')}.com",
+        "recipient_hint": recipient or default_privacy_contact(platform),
     }
+
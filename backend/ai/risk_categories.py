@@ -109,3 +109,14 @@ PLATFORM_WARNINGS: dict[str, str] = {
         "Change passwords on all affected services and enable MFA."
     ),
 }
+
+
+# Base score used for platforms missing from PLATFORM_BASE_SCORES
+DEFAULT_BASE_SCORE = 5.0
+
+# Platform → (base score, warning or None), derived once from the tables above
+# so scoring a finding needs a single lookup.
+PLATFORM_PROFILES: dict[str, tuple[float, str | None]] = {
+    platform: (PLATFORM_BASE_SCORES.get(platform, DEFAULT_BASE_SCORE), PLATFORM_WARNINGS.get(platform))
+    for platform in PLATFORM_BASE_SCORES.keys() | PLATFORM_WARNINGS.keys()
+}
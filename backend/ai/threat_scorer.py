@@ -11,11 +11,13 @@ from typing import Any
 from scrapers.base import ScraperResult
 from ai.risk_categories import (
     CATEGORY_DESCRIPTIONS,
-    PLATFORM_BASE_SCORES,
-    PLATFORM_WARNINGS,
+    DEFAULT_BASE_SCORE,
+    PLATFORM_PROFILES,
     RiskCategory,
 )
 
+_DEFAULT_PROFILE: tuple[float, str | None] = (DEFAULT_BASE_SCORE, None)
+
 
 def analyze_findings(results: list[ScraperResult]) -> dict[str, Any]:
     """
@@ -32,52 +34,63 @@ def analyze_findings(results: list[ScraperResult]) -> dict[str, Any]:
     total_platforms = len(results)
     exposed_platforms = len(found_results)
 
+    # Clean scan — nothing to score, return the canonical empty report
+    if not found_results:
+        return {
+            "overall_score": 0.0,
+            "risk_level": "low",
+            "summary": _generate_summary(0, total_platforms, 0.0, "low", {}),
+            "recommendations": list(_NO_ACTION_RECS),
+            # Fresh containers so callers can't mutate the shared template
+            "category_scores": [
+                {**entry, "platforms_found": [], "warnings": []}
+                for entry in _EMPTY_CATEGORY_SCORES
+            ],
+        }
+
     # ── Per-category analysis ─────────────────────────────────────────
+    # Group, score and collect warnings for every finding in a single pass
     category_hits: dict[str, list[ScraperResult]] = {}
+    category_totals: dict[str, float] = {}
+    category_warnings: dict[str, list[str]] = {}
     for r in found_results:
         cat = r.risk_category or RiskCategory.REPUTATIONAL
         category_hits.setdefault(cat, []).append(r)
 
-    category_scores: list[dict[str, Any]] = []
-    total_weighted_score = 0.0
-    max_possible_score = 0.0
+        base, warning = PLATFORM_PROFILES.get(r.platform, _DEFAULT_PROFILE)
+        # Boost score based on data richness
+        data_bonus = min(len(r.data) * 0.3, 2.0) if r.data else 0.0
+        category_totals[cat] = category_totals.get(cat, 0.0) + min(base + data_bonus, 10.0)
 
-    for cat in RiskCategory:
-        hits = category_hits.get(cat.value, [])
-        cat_score = 0.0
-        warnings: list[str] = []
+        # Add platform-specific warning if available
+        if warning:
+            category_warnings.setdefault(cat, []).append(warning)
 
-        for hit in hits:
-            base = PLATFORM_BASE_SCORES.get(hit.platform, 5.0)
-            # Boost score based on data richness
-            data_bonus = min(len(hit.data) * 0.3, 2.0) if hit.data else 0.0
-            platform_score = min(base + data_bonus, 10.0)
-            cat_score += platform_score
+    category_scores: list[dict[str, Any]] = []
+    total_weighted_score = 0.0
 
-            # Add platform-specific warning if available
-            if hit.platform in PLATFORM_WARNINGS:
-                warnings.append(PLATFORM_WARNINGS[hit.platform])
+    for cat_value, weight, description in _CATS:
+        hits = category_hits.get(cat_value, [])
+        cat_score = category_totals.get(cat_value, 0.0)
 
         # Normalize category score to 0–100 scale
         # Max realistic score per category is ~30 (3 platforms × 10)
         normalized = min((cat_score / 30.0) * 100.0, 100.0) if hits else 0.0
 
         # Weight categories differently for overall score
-        weight = _category_weight(cat)
         total_weighted_score += normalized * weight
-        max_possible_score += 100.0 * weight
 
         category_scores.append({
-            "category": cat.value,
+            "category": cat_value,
             "score": round(normalized, 1),
-            "description": CATEGORY_DESCRIPTIONS.get(cat.value, ""),
+            "description": description,
             "platforms_found": [h.platform for h in hits],
-            "warnings": warnings,
+            "warnings": category_warnings.get(cat_value, []),
         })
 
     # ── Overall score ─────────────────────────────────────────────────
     overall_score = round(
-        (total_weighted_score / max_possible_score) * 100.0 if max_possible_score > 0 else 0.0,
+        (total_weighted_score / _MAX_WEIGHTED_SCORE) * 100.0 if _MAX_WEIGHTED_SCORE > 0 else 0.0,
         1,
     )
 
@@ -102,17 +115,42 @@ def analyze_findings(results: list[ScraperResult]) -> dict[str, Any]:
 # ── Helpers ───────────────────────────────────────────────────────────
 
 
+# Higher weight for more dangerous categories
+_CATEGORY_WEIGHTS: dict[RiskCategory, float] = {
+    RiskCategory.DATA_BREACH: 0.30,
+    RiskCategory.INFRASTRUCTURE: 0.20,
+    RiskCategory.PHISHING: 0.20,
+    RiskCategory.IMPERSONATION: 0.15,
+    RiskCategory.STALKING: 0.10,
+    RiskCategory.REPUTATIONAL: 0.05,
+}
+
+
 def _category_weight(cat: RiskCategory) -> float:
     """Higher weight for more dangerous categories."""
-    weights = {
-        RiskCategory.DATA_BREACH: 0.30,
-        RiskCategory.INFRASTRUCTURE: 0.20,
-        RiskCategory.PHISHING: 0.20,
-        RiskCategory.IMPERSONATION: 0.15,
-        RiskCategory.STALKING: 0.10,
-        RiskCategory.REPUTATIONAL: 0.05,
+    return _CATEGORY_WEIGHTS.get(cat, 0.10)
+
+
+# (value, weight, description) per category, in RiskCategory order —
+# resolved once so scoring doesn't pay for enum iteration and lookups
+_CATS: tuple[tuple[str, float, str], ...] = tuple(
+    (cat.value, _category_weight(cat), CATEGORY_DESCRIPTIONS.get(cat.value, ""))
+    for cat in RiskCategory
+)
+_MAX_WEIGHTED_SCORE = sum(100.0 * weight for _, weight, _ in _CATS)
+
+
+# Category breakdown for a scan with no hits, precomputed at import
+_EMPTY_CATEGORY_SCORES: tuple[dict[str, Any], ...] = tuple(
+    {
+        "category": cat_value,
+        "score": 0.0,
+        "description": description,
+        "platforms_found": [],
+        "warnings": [],
     }
-    return weights.get(cat, 0.10)
+    for cat_value, _, description in _CATS
+)
 
 
 def _risk_level(score: float) -> str:
@@ -160,67 +198,62 @@ def _generate_summary(
     return " ".join(parts)
 
 
+# Ordered by priority — data breach advice always comes first.
+_RECS_BY_CATEGORY: dict[str, tuple[str, ...]] = {
+    RiskCategory.DATA_BREACH.value: (
+        "🔑 CHANGE ALL PASSWORDS IMMEDIATELY on accounts associated with breached emails.",
+        "🛡️ ENABLE MFA (Multi-Factor Authentication) on every account that supports it.",
+        "📧 Consider using a password manager to generate unique passwords per site.",
+        "🔍 Review the specific breaches listed and check what data types were exposed.",
+    ),
+    RiskCategory.INFRASTRUCTURE.value: (
+        "🔒 Audit all internet-facing services for misconfigurations and open ports.",
+        "🛡️ Ensure firewalls and access controls are properly configured.",
+        "📡 Close or restrict any unnecessary publicly-exposed services.",
+    ),
+    RiskCategory.PHISHING.value: (
+        "📧 Be vigilant against spear-phishing emails referencing your professional details.",
+        "🔐 Enable email filtering and anti-phishing protections.",
+        "👥 Limit the professional information publicly visible on LinkedIn.",
+    ),
+    RiskCategory.IMPERSONATION.value: (
+        "👤 Review your Facebook privacy settings — restrict profile visibility to friends only.",
+        "🔍 Search for impersonation accounts using your name and photos.",
+        "📱 Enable login alerts on all social media accounts.",
+    ),
+    RiskCategory.STALKING.value: (
+        "📍 Disable location tagging on photos and posts.",
+        "🔒 Set social media profiles to private where possible.",
+        "🚫 Review and remove old posts that reveal personal routines or locations.",
+    ),
+    RiskCategory.REPUTATIONAL.value: (
+        "📝 Audit public posts and comments across forums for potentially damaging content.",
+    ),
+}
+
+# General recommendations if anything was found
+_GENERAL_RECS: tuple[str, ...] = (
+    "📋 Use the Takedown feature to generate GDPR/CCPA data deletion requests.",
+    "🔄 Schedule regular privacy audits (recommended: quarterly).",
+)
+
+_NO_ACTION_RECS: tuple[str, ...] = (
+    "✅ No immediate actions required. Keep monitoring your digital footprint periodically.",
+)
+
+
 def _generate_recommendations(
     category_hits: dict[str, list[ScraperResult]],
     found_results: list[ScraperResult],
 ) -> list[str]:
-    recs: list[str] = []
-
-    # Data breach recommendations (highest priority)
-    if RiskCategory.DATA_BREACH.value in category_hits:
-        recs.extend([
-            "🔑 CHANGE ALL PASSWORDS IMMEDIATELY on accounts associated with breached emails.",
-            "🛡️ ENABLE MFA (Multi-Factor Authentication) on every account that supports it.",
-            "📧 Consider using a password manager to generate unique passwords per site.",
-            "🔍 Review the specific breaches listed and check what data types were exposed.",
-        ])
-
-    # Infrastructure recommendations
-    if RiskCategory.INFRASTRUCTURE.value in category_hits:
-        recs.extend([
-            "🔒 Audit all internet-facing services for misconfigurations and open ports.",
-            "🛡️ Ensure firewalls and access controls are properly configured.",
-            "📡 Close or restrict any unnecessary publicly-exposed services.",
-        ])
-
-    # Phishing recommendations
-    if RiskCategory.PHISHING.value in category_hits:
-        recs.extend([
-            "📧 Be vigilant against spear-phishing emails referencing your professional details.",
-            "🔐 Enable email filtering and anti-phishing protections.",
-            "👥 Limit the professional information publicly visible on LinkedIn.",
-        ])
-
-    # Social engineering / impersonation
-    if RiskCategory.IMPERSONATION.value in category_hits:
-        recs.extend([
-            "👤 Review your Facebook privacy settings — restrict profile visibility to friends only.",
-            "🔍 Search for impersonation accounts using your name and photos.",
-            "📱 Enable login alerts on all social media accounts.",
-        ])
-
-    # Stalking risk
-    if RiskCategory.STALKING.value in category_hits:
-        recs.extend([
-            "📍 Disable location tagging on photos and posts.",
-            "🔒 Set social media profiles to private where possible.",
-            "🚫 Review and remove old posts that reveal personal routines or locations.",
-        ])
-
-    # Reputational risk
-    if RiskCategory.REPUTATIONAL.value in category_hits:
-        recs.append(
-            "📝 Audit public posts and comments across forums for potentially damaging content."
-        )
+    recs = [
+        rec
+        for cat, cat_recs in _RECS_BY_CATEGORY.items()
+        if cat in category_hits
+        for rec in cat_recs
+    ]
 
-    # General recommendations if anything was found
     if found_results:
-        recs.extend([
-            "📋 Use the Takedown feature to generate GDPR/CCPA data deletion requests.",
-            "🔄 Schedule regular privacy audits (recommended: quarterly).",
-        ])
-
-    if not recs:
-        recs.append("✅ No immediate actions required. Keep monitoring your digital footprint periodically.")
+        recs.extend(_GENERAL_RECS)
 
-    return recs
+    return recs or list(_NO_ACTION_RECS)
@@ -1,47 +1,91 @@
 """
-Kashf Backend — GET /results/{task_id} Endpoint
-Returns aggregated scan results to the React frontend.
+Kashf Backend — GET /results/{task_id} Endpoints
+Returns aggregated scan results to the React frontend, either on demand
+or pushed as Server-Sent Events while the scan runs.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from database import Finding, ScanTask, ThreatReport, get_session
+from database import AsyncSessionLocal, Finding, ScanTask, get_session
 from schemas import (
     CategoryScore,
     FindingOut,
     ResultsResponse,
     ThreatReportOut,
 )
+from scrapers.manager import PROGRESS
+from utils import json, scan_events
 
 router = APIRouter(tags=["Results"])
 
+# Completed scans never change, so the client may reuse them without
+# re-polling — but they are personal data, so shared caches must not keep them
+_COMPLETED_CACHE_CONTROL = "private, max-age=300"
 
-@router.get("/results/{task_id}", response_model=ResultsResponse)
+
+def _results_etag(task: ScanTask) -> str:
+    """Strong ETag for a completed task — its id and completion time."""
+    digest = hashlib.blake2b(f"{task.id}:{task.completed_at}".encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    return any(
+        tag.strip().removeprefix("W/") in (etag, "*")
+        for tag in if_none_match.split(",")
+    )
+
+
+@router.get("/results/{task_id}", response_model=ResultsResponse, deprecated=True)
 async def get_results(
     task_id: str,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
-) -> ResultsResponse:
+) -> ResultsResponse | Response:
     """
     Retrieve the status and results for a scan task.
 
     Returns the current progress, all findings, and the threat report
-    once the scan is complete. The React frontend should poll this
-    endpoint until `status` is `"completed"` or `"failed"`.
+    once the scan is complete. Kept for clients that poll until `status`
+    is `"completed"` or `"failed"` — prefer `GET /results/{task_id}/stream`.
+
+    Completed results carry an `ETag`; repeat requests sending it back in
+    `If-None-Match` get a bodyless `304 Not Modified`.
     """
-    # Fetch the task
-    task = await session.get(ScanTask, task_id)
+    # Fetch the task together with its threat report in one round-trip
+    task = await session.get(ScanTask, task_id, options=[joinedload(ScanTask.threat_report)])
     if not task:
         raise HTTPException(status_code=404, detail=f"Scan task '{task_id}' not found")
 
+    # Completed results are immutable — skip all further work on a cache hit
+    etag = _results_etag(task) if task.status == "completed" else None
+    if etag:
+        cache_headers = {"ETag": etag, "Cache-Control": _COMPLETED_CACHE_CONTROL}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=cache_headers)
+        response.headers.update(cache_headers)
+
+    return await _load_results(session, task)
+
+
+async def _load_results(session: AsyncSession, task: ScanTask) -> ResultsResponse:
+    """Assemble the full results payload for a task (threat report preloaded)."""
     # Fetch all findings
     result = await session.execute(
-        select(Finding).where(Finding.task_id == task_id).order_by(Finding.checked_at)
+        select(Finding).where(Finding.task_id == task.id).order_by(Finding.checked_at)
     )
     findings_db = result.scalars().all()
 
@@ -50,12 +94,9 @@ async def get_results(
         data = None
         error_msg = None
         if f.data_found:
-            try:
-                raw = json.loads(f.data_found)
-                error_msg = raw.pop("_error", None)
-                data = raw if raw else None
-            except json.JSONDecodeError:
-                data = {"raw": f.data_found}
+            raw = dict(f.data_found)  # already decoded by the JSON column type
+            error_msg = raw.pop("_error", None)
+            data = raw if raw else None
 
         findings_out.append(
             FindingOut(
@@ -69,16 +110,13 @@ async def get_results(
             )
         )
 
-    # Fetch threat report if it exists
+    # Threat report (if any) was loaded with the task
     report_out = None
-    result = await session.execute(
-        select(ThreatReport).where(ThreatReport.task_id == task_id)
-    )
-    report_db = result.scalars().first()
+    report_db = task.threat_report
 
     if report_db:
         summary = report_db.summary or ""
-        if summary.startswith('"') or summary.startswith("{"):
+        if summary and summary[0] in '"{':  # JSON-encoded summary
             try:
                 summary = json.loads(summary)
             except json.JSONDecodeError:
@@ -118,7 +156,8 @@ async def get_results(
     return ResultsResponse(
         task_id=task.id,
         status=task.status,
-        progress=task.progress or 0,
+        # Running scans report live progress; the row only has 0 or 100
+        progress=PROGRESS.get(task.id, task.progress or 0),
         query=task.query,
         query_type=task.query_type,
         created_at=task.created_at,
@@ -126,3 +165,77 @@ async def get_results(
         findings=findings_out,
         threat_report=report_out,
     )
+
+
+# ── Streaming ─────────────────────────────────────────────────────────
+
+# Idle streams get a comment line this often so proxies keep them open
+_STREAM_KEEPALIVE_SECONDS = 15.0
+_TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+
+def _sse(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+@router.get("/results/{task_id}/stream")
+async def stream_results(
+    task_id: str,
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """
+    Stream a scan's progress as Server-Sent Events.
+
+    Emits a `progress` event as each platform check finishes, then a single
+    `result` event carrying the same payload as `GET /results/{task_id}` once
+    the scan reaches a terminal state, and closes the stream.
+    """
+    # Subscribe before reading the status so a scan finishing in between
+    # can't slip its completion event past us
+    queue = scan_events.subscribe(task_id)
+    task = await session.get(ScanTask, task_id)
+    if not task:
+        scan_events.unsubscribe(task_id, queue)
+        raise HTTPException(status_code=404, detail=f"Scan task '{task_id}' not found")
+
+    status, progress = task.status, PROGRESS.get(task_id, task.progress or 0)
+
+    async def _events() -> AsyncIterator[str]:
+        nonlocal status
+        try:
+            yield _sse("progress", json.dumps({"status": status, "progress": progress}))
+
+            while status not in _TERMINAL_STATUSES:
+                try:
+                    event = await asyncio.wait_for(queue.get(), _STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Quiet for a while — make sure the scan is still alive
+                    # before holding the connection open any longer
+                    async with AsyncSessionLocal() as stream_session:
+                        status = await stream_session.scalar(
+                            select(ScanTask.status).where(ScanTask.id == task_id)
+                        )
+                    if status is None or status in _TERMINAL_STATUSES:
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+                status = event["status"]
+                if status not in _TERMINAL_STATUSES:
+                    yield _sse("progress", json.dumps(event))
+
+            async with AsyncSessionLocal() as stream_session:
+                final = await stream_session.get(
+                    ScanTask, task_id, options=[joinedload(ScanTask.threat_report)]
+                )
+                if final is None:  # wiped while streaming
+                    return
+                results = await _load_results(stream_session, final)
+            yield _sse("result", results.model_dump_json())
+        finally:
+            scan_events.unsubscribe(task_id, queue)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import ScanTask, get_session
 from schemas import SearchRequest, SearchResponse
 from scrapers.manager import run_scan
+from utils.secure_wipe import notify_new_task
 
 router = APIRouter(tags=["Search"])
 
@@ -38,6 +39,7 @@ async def start_search(
     session.add(task)
     await session.commit()
     await session.refresh(task)
+    notify_new_task()  # schedule its eventual auto-wipe
 
     # Launch the scraper manager in the background
     background_tasks.add_task(run_scan, task.id, task.query, task.query_type)
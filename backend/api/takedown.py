@@ -5,8 +5,6 @@ Generates a GDPR/CCPA-compliant data deletion email using local AI.
 
 from __future__ import annotations
 
-import json
-
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -47,15 +45,10 @@ async def create_takedown(
     )
     finding = result.scalars().first()
 
-    findings_data = None
-    if finding and finding.data_found:
-        try:
-            findings_data = json.loads(finding.data_found)
-        except json.JSONDecodeError:
-            findings_data = {"raw": finding.data_found}
+    findings_data = finding.data_found if finding and finding.data_found else None
 
     # Generate the takedown email (LLM → template fallback)
-    email_data = generate_takedown_email(
+    email_data = await generate_takedown_email(
         platform=request.platform,
         user_name=request.user_name,
         user_email=request.user_email,
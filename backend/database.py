@@ -3,32 +3,85 @@ Kashf Backend — Database Layer
 Async SQLAlchemy with SQLite for scan tasks, findings, and threat reports.
 """
 
+import logging
 import uuid
-from datetime import datetime, timezone
 
 from sqlalchemy import (
     Column,
     DateTime,
     Float,
+    JSON,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    TypeDecorator,
     create_engine,
+    event,
+    func,
+    inspect,
+    make_url,
 )
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, relationship, sessionmaker
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from config import settings
+from utils import json
+
+logger = logging.getLogger("kashf.database")
 
 # ── Async Engine & Session ────────────────────────────────────────────
-async_engine = create_async_engine(settings.DATABASE_URL, echo=False)
-AsyncSessionLocal = sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+_db_url = make_url(settings.DATABASE_URL)
+_is_file_sqlite = (
+    _db_url.get_backend_name() == "sqlite" and _db_url.database not in (None, "", ":memory:")
+)
+
+# aiosqlite defaults to NullPool for file databases — a new connection (and
+# worker thread, and PRAGMA round) per session. Keep a small pool instead,
+# sized for a scan's burst of writes. In-memory databases keep the default.
+_engine_kwargs: dict = (
+    {"poolclass": AsyncAdaptedQueuePool, "pool_size": 5, "max_overflow": 10}
+    if _is_file_sqlite
+    else {}
+)
+async_engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    json_serializer=json.dumps,  # orjson for the JSON columns
+    json_deserializer=json.loads,
+    **_engine_kwargs,
+)
+
+# Tuning for file-backed SQLite: WAL lets the results endpoints read while a
+# scan is writing, and NORMAL sync only fsyncs at checkpoints (safe in WAL).
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # 64 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA busy_timeout=5000",
 )
 
+if _db_url.get_backend_name() == "sqlite":
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _tune_sqlite(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        # Off by default in SQLite; the ON DELETE CASCADE wipes depend on it
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if _is_file_sqlite:
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        cursor.close()
+
+
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
@@ -39,8 +92,29 @@ def _generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
-def _utc_now() -> datetime:
-    return datetime.now(timezone.utc)
+class UUIDBinary(TypeDecorator):
+    """
+    UUID stored as its raw 16 bytes, exposed to Python as the canonical
+    string — half the key size of String(36) in every index and FK column.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return uuid.UUID(str(value)).bytes
+        except ValueError:
+            # Not a UUID (e.g. a mistyped task id): bind something that
+            # matches no row, so lookups simply come back empty.
+            return str(value).encode()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
 
 
 # ── Models ────────────────────────────────────────────────────────────
@@ -51,18 +125,26 @@ class ScanTask(Base):
 
     __tablename__ = "scan_tasks"
 
-    id = Column(String(36), primary_key=True, default=_generate_uuid)
+    id = Column(UUIDBinary, primary_key=True, default=_generate_uuid)
     query = Column(String(255), nullable=False, index=True)
     query_type = Column(String(20), nullable=False)  # "email" | "username"
     status = Column(String(20), nullable=False, default="pending")
     progress = Column(Integer, default=0)  # 0–100%
-    created_at = Column(DateTime, default=_utc_now)
+    # Timestamps are stamped by the database (UTC) at insert time
+    created_at = Column(DateTime, server_default=func.now(), index=True)  # auto-wipe range scans
     completed_at = Column(DateTime, nullable=True)
 
     # Relationships
-    findings = relationship("Finding", back_populates="task", cascade="all, delete-orphan")
+    # Children are removed by the database's ON DELETE CASCADE, not loaded first
+    findings = relationship(
+        "Finding", back_populates="task", cascade="all, delete-orphan", passive_deletes=True
+    )
     threat_report = relationship(
-        "ThreatReport", back_populates="task", uselist=False, cascade="all, delete-orphan"
+        "ThreatReport",
+        back_populates="task",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -73,16 +155,23 @@ class Finding(Base):
     """A single discovery from a scraper — one per platform hit."""
 
     __tablename__ = "findings"
+    # Serves GET /results (filter by task, ordered by check time) and, by its
+    # task_id prefix, the per-task deletes
+    __table_args__ = (Index("ix_findings_task_checked", "task_id", "checked_at"),)
 
-    id = Column(String(36), primary_key=True, default=_generate_uuid)
-    task_id = Column(String(36), ForeignKey("scan_tasks.id"), nullable=False, index=True)
+    id = Column(UUIDBinary, primary_key=True, default=_generate_uuid)
+    task_id = Column(UUIDBinary, ForeignKey("scan_tasks.id", ondelete="CASCADE"), nullable=False)
     platform = Column(String(50), nullable=False)
     url = Column(String(500), nullable=True)
     found = Column(Integer, default=0)  # 1 = found, 0 = not found
-    data_found = Column(Text, nullable=True)  # JSON string of extracted data
+    # Extracted data — JSONB on PostgreSQL, JSON text on SQLite; loaded as a dict
+    data_found = Column(
+        JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
     risk_category = Column(String(50), nullable=True)
     risk_score = Column(Float, default=0.0)  # 0.0–10.0
-    checked_at = Column(DateTime, default=_utc_now)
+    checked_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     task = relationship("ScanTask", back_populates="findings")
@@ -96,14 +185,16 @@ class ThreatReport(Base):
 
     __tablename__ = "threat_reports"
 
-    id = Column(String(36), primary_key=True, default=_generate_uuid)
-    task_id = Column(String(36), ForeignKey("scan_tasks.id"), nullable=False, unique=True)
+    id = Column(UUIDBinary, primary_key=True, default=_generate_uuid)
+    task_id = Column(
+        UUIDBinary, ForeignKey("scan_tasks.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
     overall_score = Column(Float, default=0.0)  # 0.0–100.0
     risk_level = Column(String(20), default="low")  # low / medium / high / critical
     summary = Column(Text, nullable=True)  # JSON string
     recommendations = Column(Text, nullable=True)  # JSON string
     category_scores = Column(Text, nullable=True)  # JSON string — per-category breakdown
-    generated_at = Column(DateTime, default=_utc_now)
+    generated_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     task = relationship("ScanTask", back_populates="threat_report")
@@ -115,9 +206,59 @@ class ThreatReport(Base):
 # ── Helpers ───────────────────────────────────────────────────────────
 
 
+# Leftovers of a findings FTS5 index that never got a reader — its triggers
+# would otherwise keep taxing every findings write on existing databases
+_DROP_FINDINGS_FTS = (
+    "DROP TRIGGER IF EXISTS findings_fts_ai",
+    "DROP TRIGGER IF EXISTS findings_fts_ad",
+    "DROP TRIGGER IF EXISTS findings_fts_au",
+    "DROP TABLE IF EXISTS findings_fts",
+)
+
+
+def _schema_is_current(sync_conn) -> bool:
+    """
+    Whether existing tables match the models' storage layout: binary UUID
+    keys, a JSON findings payload and ON DELETE CASCADE foreign keys.
+    Databases created before those changes fail every query against them.
+    """
+    inspector = inspect(sync_conn)
+    tables = set(inspector.get_table_names())
+    if not tables & set(Base.metadata.tables):
+        return True  # fresh database
+
+    for table in tables & set(Base.metadata.tables):
+        columns = {c["name"]: c["type"] for c in inspector.get_columns(table)}
+        if not isinstance(columns.get("id"), LargeBinary):
+            return False
+
+    if "findings" in tables:
+        data_found = next(
+            (c["type"] for c in inspector.get_columns("findings") if c["name"] == "data_found"), None
+        )
+        if not isinstance(data_found, JSON):
+            return False
+
+    for table in tables & {"findings", "threat_reports"}:
+        for fk in inspector.get_foreign_keys(table):
+            if (fk.get("options", {}).get("ondelete") or "").upper() != "CASCADE":
+                return False
+    return True
+
+
 async def init_db() -> None:
-    """Create all tables if they don't exist."""
+    """
+    Create all tables if they don't exist. Tables from an older, incompatible
+    schema are dropped and recreated — scan data only lives for
+    DATA_TTL_HOURS anyway.
+    """
     async with async_engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            for statement in _DROP_FINDINGS_FTS:
+                await conn.exec_driver_sql(statement)
+        if not await conn.run_sync(_schema_is_current):
+            logger.warning("⚠️  Outdated database schema — dropping and recreating scan tables")
+            await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
 
 
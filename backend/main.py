@@ -14,13 +14,17 @@ from __future__ import annotations
 import asyncio
 import logging
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from ai.llm_service import check_model_quantization, llm_scheduler
 from config import settings
-from database import init_db
-from utils.secure_wipe import wipe_expired_tasks
+from database import async_engine, init_db
+from scrapers.http_client import close_http_client
+from utils.secure_wipe import get_soonest_expiry, wait_for_new_task, wipe_expired_tasks
 
 # ── Logging setup ─────────────────────────────────────────────────────
 logging.basicConfig(
@@ -30,16 +34,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger("kashf")
 
+# ── Event loop ────────────────────────────────────────────────────────
+# uvloop schedules the scraper fan-out with far less per-task overhead than
+# the stock selector loop. Not available on Windows — keep asyncio's there.
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
 # ── Background auto-wipe task ─────────────────────────────────────────
+_MIN_WIPE_INTERVAL = 60.0  # seconds
+_WIPE_RETRY_INTERVAL = 3600.0  # seconds, after a failed pass
+
+
 async def _auto_wipe_loop() -> None:
-    """Periodically wipe expired scan data for privacy."""
+    """Wipe expired scan data for privacy, waking exactly when the next task expires."""
     while True:
         try:
             await wipe_expired_tasks()
+            next_expiry = await get_soonest_expiry()
         except Exception as exc:
             logger.error(f"Auto-wipe error: {exc}")
-        await asyncio.sleep(3600)  # Check every hour
+            await asyncio.sleep(_WIPE_RETRY_INTERVAL)
+            continue
+
+        if next_expiry is None:
+            # Nothing stored — sleep until the next scan is created
+            await wait_for_new_task(None)
+            continue
+
+        delay = (next_expiry - datetime.now(timezone.utc)).total_seconds()
+        await wait_for_new_task(max(_MIN_WIPE_INTERVAL, delay))
 
 
 # ── App lifespan ──────────────────────────────────────────────────────
@@ -57,6 +85,7 @@ async def lifespan(app: FastAPI):
 
     if settings.LLM_MODEL_PATH:
         logger.info(f"🧠 LLM model configured: {settings.LLM_MODEL_PATH}")
+        check_model_quantization(settings.LLM_MODEL_PATH)
     else:
         logger.info("📝 No LLM model configured — using template-based takedown emails")
 
@@ -66,6 +95,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     wipe_task.cancel()
+    await llm_scheduler.stop()
+    await close_http_client()
+    await async_engine.dispose()
     logger.info("👋 Kashf backend shutting down")
 
 
@@ -81,6 +113,7 @@ app = FastAPI(
     ),
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -117,6 +150,7 @@ async def root():
         "endpoints": {
             "search": "POST /search",
             "results": "GET /results/{task_id}",
+            "results_stream": "GET /results/{task_id}/stream",
             "takedown": "POST /takedown",
             "docs": "GET /docs",
         },
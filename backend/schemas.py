@@ -8,7 +8,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ── Search ────────────────────────────────────────────────────────────
@@ -29,11 +29,19 @@ class SearchResponse(BaseModel):
     message: str = "Scan initiated. Use GET /results/{task_id} to poll for results."
 
 
+# Response models are built once per request and never mutated afterwards.
+# Pydantic v2 has no __slots__ support for BaseModel, so freezing them and
+# skipping assignment validation is the cheapest configuration available.
+_OUTPUT_CONFIG = ConfigDict(frozen=True, validate_assignment=False)
+
+
 # ── Findings ──────────────────────────────────────────────────────────
 
 
 class FindingOut(BaseModel):
     """Single finding returned to the frontend."""
+    model_config = _OUTPUT_CONFIG
+
     platform: str
     url: str | None = None
     found: bool = False
@@ -48,6 +56,8 @@ class FindingOut(BaseModel):
 
 class CategoryScore(BaseModel):
     """Per-category risk breakdown."""
+    model_config = _OUTPUT_CONFIG
+
     category: str
     score: float
     description: str
@@ -56,6 +66,8 @@ class CategoryScore(BaseModel):
 
 class ThreatReportOut(BaseModel):
     """Aggregated threat report."""
+    model_config = _OUTPUT_CONFIG
+
     overall_score: float = 0.0
     risk_level: str = "low"
     summary: str = ""
@@ -68,6 +80,8 @@ class ThreatReportOut(BaseModel):
 
 class ResultsResponse(BaseModel):
     """Response from GET /results/{task_id}."""
+    model_config = _OUTPUT_CONFIG
+
     task_id: str
     status: str
     progress: int = 0
@@ -6,23 +6,39 @@ Abstract base class for all OSINT scrapers.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-import random
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, replace
+from typing import Any, ClassVar
 
 import httpx
+from cachetools import TTLCache
+from selectolax.parser import HTMLParser
 
 from config import settings
+from scrapers.http_client import get_host_pool
+from utils import json
 
 logger = logging.getLogger("kashf.scrapers")
 
+# Login-wall / bot-check pages, matched case-insensitively on the raw body
+_AUTH_WALL_MARKERS = (
+    b"just a moment",            # Cloudflare
+    b"cf-browser-verification",  # Cloudflare
+    b"you must log in",
+    b"log in or sign up",        # Facebook
+    b"join now to see",          # LinkedIn
+    b"authwall",                 # LinkedIn
+    b"sign in to x",             # Twitter/X
+    b"log into instagram",       # Instagram
+)
+_AUTH_WALL_RE = re.compile(b"|".join(map(re.escape, _AUTH_WALL_MARKERS)), re.IGNORECASE)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ScraperResult:
-    """Standardized result returned by every scraper."""
+    """Standardized result returned by every scraper (immutable, slotted)."""
     platform: str
     url: str | None = None
     found: bool = False
@@ -32,6 +48,42 @@ class ScraperResult:
     error: str | None = None
 
 
+# Recent results per (platform, query_type, query), so repeat scans of the
+# same target skip the network. Entries never outlive the data TTL.
+_RESULT_CACHE: TTLCache[tuple[str, str, str], ScraperResult] = TTLCache(
+    maxsize=10_000, ttl=settings.DATA_TTL_HOURS * 3600
+)
+
+
+def evict_cached_results(query: str, query_type: str) -> None:
+    """Drop every platform's cached result for one target."""
+    for key in [k for k in _RESULT_CACHE.keys() if k[1:] == (query_type, query)]:
+        _RESULT_CACHE.pop(key, None)
+
+
+def clear_result_cache() -> None:
+    """Drop every cached result."""
+    _RESULT_CACHE.clear()
+
+
+# Pages whose metadata is all we need are only read up to the end of <head>
+_HEAD_END = b"</head>"
+_HEAD_END_RE = re.compile(re.escape(_HEAD_END), re.IGNORECASE)
+_HEAD_SECTION_MAX_BYTES = 64 * 1024
+
+# (ETag, decoded body) of recent JSON API responses, by URL — lets repeat
+# lookups revalidate with If-None-Match and reuse the body on a 304. The
+# bodies are personal data, so they expire with it too.
+_ETAG_CACHE: TTLCache[str, tuple[str, Any]] = TTLCache(
+    maxsize=1024, ttl=settings.DATA_TTL_HOURS * 3600
+)
+
+
+def clear_etag_cache() -> None:
+    """Forget every cached API response (called when scan data is wiped)."""
+    _ETAG_CACHE.clear()
+
+
 class BaseScraper(ABC):
     """
     Abstract base for all platform scrapers.
@@ -43,8 +95,18 @@ class BaseScraper(ABC):
       - check()        (async method)
     """
 
-    def __init__(self) -> None:
-        self._client: httpx.AsyncClient | None = None
+    # base_url parsed once per subclass — see _url()
+    _base: ClassVar[httpx.URL]
+    # Query types check() can handle; anything else is "not found" up front
+    supported_query_types: ClassVar[frozenset[str]] = frozenset({"email", "username"})
+    # Body marker of the platform's "profile not found" page, if it has one
+    _NOT_FOUND_RE: ClassVar[re.Pattern[bytes] | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        base_url = cls.__dict__.get("base_url")
+        if isinstance(base_url, str):
+            cls._base = httpx.URL(base_url)
 
     # ── Abstract interface ────────────────────────────────────────────
 
@@ -63,40 +125,132 @@ class BaseScraper(ABC):
     @abstractmethod
     async def check(self, query: str, query_type: str) -> ScraperResult: ...
 
+    async def cached_check(self, query: str, query_type: str) -> ScraperResult:
+        """`check()` behind the result cache. Errors are never cached."""
+        if query_type not in self.supported_query_types:
+            return self._not_found()
+
+        key = (self.platform_name, query_type, query)
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            return replace(cached, data=dict(cached.data))
+
+        result = await self.check(query, query_type)
+        if result.error is None:
+            _RESULT_CACHE[key] = replace(result, data=dict(result.data))
+        return result
+
     # ── Shared helpers ────────────────────────────────────────────────
 
-    def _random_ua(self) -> str:
-        return random.choice(settings.USER_AGENTS)
+    @classmethod
+    def _get_client(cls, url: str | httpx.URL) -> httpx.AsyncClient:
+        """The pooled client for `url`'s host (it carries its own User-Agent)."""
+        return get_host_pool().client_for(url)
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(settings.SCRAPER_TIMEOUT),
-                follow_redirects=True,
-                headers={"User-Agent": self._random_ua()},
-            )
-        return self._client
+    def _url(self, path: str) -> httpx.URL:
+        """`base_url` + `path` (already percent-encoded), built from the pre-parsed base URL."""
+        return self._base.copy_with(path=self._base.path.rstrip("/") + path)
 
-    async def _http_get(self, url: str, **kwargs: Any) -> httpx.Response | None:
+    async def _http_get(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response | None:
         """Safe GET request that returns None on failure."""
         try:
-            client = await self._get_client()
-            resp = await client.get(url, **kwargs)
+            resp = await self._get_client(url).get(url, **kwargs)
+            get_host_pool().report(url, resp.status_code)
             return resp
         except (httpx.HTTPError, asyncio.TimeoutError) as exc:
             logger.debug(f"[{self.platform_name}] GET {url} failed: {exc}")
             return None
 
-    async def _http_head(self, url: str, **kwargs: Any) -> httpx.Response | None:
+    async def _http_get_head_section(
+        self, url: str | httpx.URL, max_bytes: int = _HEAD_SECTION_MAX_BYTES, **kwargs: Any
+    ) -> httpx.Response | None:
+        """
+        Safe GET that stops downloading once the page's `</head>` has arrived
+        (or after `max_bytes`). The returned response holds just that prefix —
+        enough for the title, meta tags and login-wall markers.
+        """
+        client = self._get_client(url)
+        try:
+            async with client.stream("GET", url, **kwargs) as resp:
+                get_host_pool().report(url, resp.status_code)
+                buf = bytearray()
+                end = max_bytes
+                async for chunk in resp.aiter_bytes():
+                    # Re-scan only the tail that could straddle the chunk boundary
+                    start = max(0, len(buf) - len(_HEAD_END) + 1)
+                    buf += chunk
+                    match = _HEAD_END_RE.search(buf, start, max_bytes)
+                    if match:
+                        end = match.end()
+                        break
+                    if len(buf) >= max_bytes:
+                        break
+                # Body is already decoded, so drop the transfer headers
+                headers = [
+                    (k, v) for k, v in resp.headers.multi_items()
+                    if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+                ]
+                return httpx.Response(
+                    resp.status_code,
+                    headers=headers,
+                    content=bytes(buf[:end]),
+                    request=resp.request,
+                    history=resp.history,
+                )
+        except (httpx.HTTPError, asyncio.TimeoutError) as exc:
+            logger.debug(f"[{self.platform_name}] GET {url} failed: {exc}")
+            return None
+
+    async def _http_head(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response | None:
         """Safe HEAD request — useful for quick existence checks."""
         try:
-            client = await self._get_client()
-            resp = await client.head(url, **kwargs)
+            resp = await self._get_client(url).head(url, **kwargs)
+            get_host_pool().report(url, resp.status_code)
             return resp
         except (httpx.HTTPError, asyncio.TimeoutError) as exc:
             logger.debug(f"[{self.platform_name}] HEAD {url} failed: {exc}")
             return None
 
+    async def _http_get_profile(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response | None:
+        """
+        Profile-page fetch: a bodyless HEAD first, so a missing profile
+        (404/410) costs no download; otherwise only the page's `<head>` is read.
+        """
+        head = await self._http_head(url, **kwargs)
+        if head is not None and head.status_code in (404, 410):
+            return head
+        return await self._http_get_head_section(url, **kwargs)
+
+    async def _get_json(self, url: str | httpx.URL, **kwargs: Any) -> Any | None:
+        """
+        Conditional GET of a JSON API resource. Returns the decoded body on
+        200, the cached body on 304, and None on any other outcome.
+        """
+        # Fold any params into the URL so they are part of the cache key
+        url = httpx.URL(url).copy_merge_params(kwargs.pop("params", None) or {})
+        key = str(url)
+        cached = _ETAG_CACHE.get(key)
+        if cached is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
+
+        resp = await self._http_get(url, **kwargs)
+        if resp is None:
+            return None
+        if resp.status_code == 304 and cached is not None:
+            return cached[1]
+        if resp.status_code != 200:
+            return None
+
+        data = json.loads(resp.content)
+        etag = resp.headers.get("ETag")
+        if etag:
+            _ETAG_CACHE[key] = (etag, data)
+        return data
+
+    async def _parse_html(self, resp: httpx.Response) -> HTMLParser:
+        """Parse a response body (selectolax) off the event loop."""
+        return await asyncio.to_thread(HTMLParser, resp.text)
+
     def _is_auth_wall(self, resp: httpx.Response) -> bool:
         """Detect login walls, auth redirects, and bot-protection pages."""
         final_url = str(resp.url).lower()
@@ -104,27 +258,19 @@ class BaseScraper(ABC):
             "/login", "/authwall", "/signin", "accounts/login", "?next=", "auth/login"
         )):
             return True
-        sample = resp.text[:4000].lower()
-        return any(m in sample for m in (
-            "just a moment",            # Cloudflare
-            "cf-browser-verification",  # Cloudflare
-            "you must log in",
-            "log in or sign up",        # Facebook
-            "join now to see",          # LinkedIn
-            "authwall",                 # LinkedIn
-            "sign in to x",             # Twitter/X
-            "log into instagram",       # Instagram
-        ))
-
-    async def close(self) -> None:
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-
-    def _ok(self, url: str, data: dict[str, Any] | None = None) -> ScraperResult:
+        # Only the head of the page; searched in place, without decoding
+        return _AUTH_WALL_RE.search(resp.content, 0, 4000) is not None
+
+    def _shows_not_found(self, resp: httpx.Response) -> bool:
+        """Whether the body carries this platform's "no such profile" marker."""
+        marker = self._NOT_FOUND_RE
+        return marker is not None and marker.search(resp.content) is not None
+
+    def _ok(self, url: str | httpx.URL, data: dict[str, Any] | None = None) -> ScraperResult:
         """Convenience: build a 'found' result."""
         return ScraperResult(
             platform=self.platform_name,
-            url=url,
+            url=str(url),
             found=True,
             data=data or {},
             risk_category=self.risk_category,
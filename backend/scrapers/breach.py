@@ -6,9 +6,11 @@ Covers: HaveIBeenPwned, Dehashed.
 from __future__ import annotations
 
 import logging
+from urllib.parse import quote
 
 from config import settings
 from scrapers.base import BaseScraper, ScraperResult
+from utils import json
 
 logger = logging.getLogger("kashf.scrapers.breach")
 
@@ -26,24 +28,26 @@ class HIBPScraper(BaseScraper):
     platform_name = "HaveIBeenPwned"
     base_url = "https://haveibeenpwned.com/api/v3"
     risk_category = "DATA_BREACH"
+    supported_query_types = frozenset({"email"})
 
-    async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type != "email":
-            return self._not_found()
-
-        api_key = settings.HIBP_API_KEY
-        if not api_key:
-            logger.warning("[HIBP] No API key configured — skipping breach check")
-            return self._error("HIBP API key not configured")
+    _PARAMS = {"truncateResponse": "false"}
 
-        url = f"{self.base_url}/breachedaccount/{query}"
-        headers = {
-            "hibp-api-key": api_key,
+    def __init__(self, api_key: str | None = None) -> None:
+        # Explicit key wins over the configured HIBP_API_KEY
+        self._api_key = api_key or settings.HIBP_API_KEY
+        # HIBP requires a fixed, descriptive User-Agent — built once per scraper
+        self._headers = {
+            "hibp-api-key": self._api_key,
             "User-Agent": "Kashf-Privacy-Dashboard",
         }
-        params = {"truncateResponse": "false"}
 
-        resp = await self._http_get(url, headers=headers, params=params)
+    async def check(self, query: str, query_type: str) -> ScraperResult:
+        if not self._api_key:
+            logger.warning("[HIBP] No API key configured — skipping breach check")
+            return self._error("HIBP API key not configured")
+
+        url = self._url(f"/breachedaccount/{quote(query, safe='@')}")
+        resp = await self._http_get(url, headers=self._headers, params=self._PARAMS)
 
         if resp is None:
             return self._error("HIBP request failed")
@@ -53,12 +57,14 @@ class HIBPScraper(BaseScraper):
             return self._not_found()
 
         if resp.status_code == 200:
-            breaches = resp.json()
-            breach_names = [b.get("Name", "Unknown") for b in breaches]
-            total_pwned = sum(b.get("PwnCount", 0) for b in breaches)
-            data_classes = set()
-            for b in breaches:
-                data_classes.update(b.get("DataClasses", []))
+            breaches = json.loads(resp.content)
+            breach_names: list[str] = []
+            total_pwned = 0
+            data_classes: set[str] = set()
+            for b in breaches:  # single pass; null fields count as empty
+                breach_names.append(b.get("Name", "Unknown"))
+                total_pwned += b.get("PwnCount", 0) or 0
+                data_classes.update(b.get("DataClasses") or ())
 
             return self._ok(
                 url=f"https://haveibeenpwned.com/account/{query}",
@@ -98,9 +104,10 @@ class DehashedScraper(BaseScraper):
 
         resp = await self._http_get(url)
         if resp and resp.status_code == 200:
-            text_lower = resp.text.lower()
+            # Search the raw bytes — no need to decode the page to find ASCII markers
+            body = resp.content.lower()
             # Check if results were found (page shows count)
-            if "no results found" not in text_lower and "entries found" in text_lower:
+            if b"no results found" not in body and b"entries found" in body:
                 return self._ok(url, {
                     "query": query,
                     "query_type": query_type,
@@ -5,9 +5,11 @@ Covers: Reddit, StackOverflow, Medium, HackerNews.
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+import re
+from urllib.parse import quote
 
 from scrapers.base import BaseScraper, ScraperResult
+from utils import json
 
 
 # ── Reddit ────────────────────────────────────────────────────────────
@@ -17,16 +19,14 @@ class RedditScraper(BaseScraper):
     platform_name = "Reddit"
     base_url = "https://www.reddit.com"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
         # Use the JSON endpoint for cleaner data
-        url = f"{self.base_url}/user/{query}/about.json"
+        url = self._url(f"/user/{quote(query, safe='@')}/about.json")
         resp = await self._http_get(url)
         if resp and resp.status_code == 200:
-            data = resp.json()
+            data = json.loads(resp.content)
             user_data = data.get("data", {})
             if user_data and not user_data.get("is_suspended", False):
                 profile_url = f"{self.base_url}/user/{query}"
@@ -49,13 +49,11 @@ class StackOverflowScraper(BaseScraper):
     platform_name = "StackOverflow"
     base_url = "https://api.stackexchange.com/2.3"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
         # Search by display name via the StackExchange API
-        url = f"{self.base_url}/users"
+        url = self._url("/users")
         params = {
             "inname": query,
             "site": "stackoverflow",
@@ -65,7 +63,7 @@ class StackOverflowScraper(BaseScraper):
         }
         resp = await self._http_get(url, params=params)
         if resp and resp.status_code == 200:
-            data = resp.json()
+            data = json.loads(resp.content)
             items = data.get("items", [])
             # Look for an exact or close username match
             for user in items:
@@ -91,19 +89,18 @@ class MediumScraper(BaseScraper):
     platform_name = "Medium"
     base_url = "https://medium.com"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"Page not found")
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/@{query}"
+        url = self._url(f"/@{quote(query, safe='@')}")
         resp = await self._http_get(url)
-        if resp and resp.status_code == 200 and "Page not found" not in resp.text:
-            soup = BeautifulSoup(resp.text, "lxml")
-            title = soup.find("title")
-            name = title.get_text(strip=True).replace(" – Medium", "") if title else query
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            bio = meta_desc["content"] if meta_desc and meta_desc.get("content") else ""
+        if resp and resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            title = tree.css_first("title")
+            name = title.text(strip=True).replace(" – Medium", "") if title else query
+            meta_desc = tree.css_first('meta[name="description"]')
+            bio = (meta_desc.attributes.get("content") if meta_desc else None) or ""
             return self._ok(url, {
                 "username": query,
                 "display_name": name,
@@ -119,15 +116,13 @@ class HackerNewsScraper(BaseScraper):
     platform_name = "HackerNews"
     base_url = "https://hacker-news.firebaseio.com/v0"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/user/{query}.json"
+        url = self._url(f"/user/{quote(query, safe='@')}.json")
         resp = await self._http_get(url)
         if resp and resp.status_code == 200:
-            data = resp.json()
+            data = json.loads(resp.content)
             if data and data.get("id"):
                 profile_url = f"https://news.ycombinator.com/user?id={query}"
                 return self._ok(profile_url, {
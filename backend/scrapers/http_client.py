@@ -0,0 +1,122 @@
+"""
+Kashf Backend — Shared HTTP Clients
+A per-host client pool for the scrapers. Connections are reused across
+requests and scans. Clients are opened lazily and closed by the app lifespan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import random
+from collections.abc import Iterator
+
+import httpx
+
+from config import settings
+
+try:  # HTTP/2 needs the optional `h2` package (httpx[http2])
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+logger = logging.getLogger("kashf.scrapers.http")
+
+
+# ── Per-host client pool ──────────────────────────────────────────────
+
+
+class HostClientPool:
+    """
+    One client per host, each with its own small connection pool and a fixed
+    User-Agent — like a browser session. A host that keeps answering 403/429
+    gets its client retired and rebuilt under a fresh User-Agent.
+    """
+
+    def __init__(
+        self,
+        user_agents: Iterator[str],
+        *,
+        max_per_host: int = 5,
+        keepalive_expiry: float = 60.0,
+        max_strikes: int = 3,
+    ) -> None:
+        self._user_agents = user_agents
+        self._limits = httpx.Limits(
+            max_connections=max_per_host,
+            max_keepalive_connections=max_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._max_strikes = max_strikes
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._strikes: dict[str, int] = {}
+        self._retiring: set[asyncio.Task] = set()
+
+    def client_for(self, url: str | httpx.URL) -> httpx.AsyncClient:
+        host = httpx.URL(url).host
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = self._clients[host] = httpx.AsyncClient(
+                http2=_HTTP2,
+                timeout=httpx.Timeout(settings.SCRAPER_TIMEOUT),
+                follow_redirects=True,
+                limits=self._limits,
+                headers={"User-Agent": next(self._user_agents)},
+            )
+        return client
+
+    def report(self, url: str | httpx.URL, status_code: int) -> None:
+        """Record a response; retire the host's client after repeated blocks."""
+        host = httpx.URL(url).host
+        if status_code not in (403, 429):
+            self._strikes.pop(host, None)
+            return
+
+        strikes = self._strikes[host] = self._strikes.get(host, 0) + 1
+        if strikes < self._max_strikes:
+            return
+
+        self._strikes.pop(host, None)
+        client = self._clients.pop(host, None)
+        if client is not None:
+            logger.info(f"[HTTP] {host} keeps blocking us — rotating its session")
+            # Let requests already in flight on it finish before closing
+            task = asyncio.create_task(self._close_later(client))
+            self._retiring.add(task)
+            task.add_done_callback(self._retiring.discard)
+
+    @staticmethod
+    async def _close_later(client: httpx.AsyncClient) -> None:
+        try:
+            await asyncio.sleep(settings.SCRAPER_TIMEOUT)
+        finally:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        retiring = list(self._retiring)
+        for task in retiring:
+            task.cancel()  # closes its client right away
+        clients, self._clients = list(self._clients.values()), {}
+        await asyncio.gather(*retiring, *(c.aclose() for c in clients), return_exceptions=True)
+
+
+_host_pool: HostClientPool | None = None
+
+
+def get_host_pool() -> HostClientPool:
+    """Return the scrapers' per-host client pool, creating it on first use."""
+    global _host_pool
+    if _host_pool is None:
+        # User-Agents pre-sampled once and handed out round-robin — rotation
+        # only needs variety, not a fresh RNG draw per client
+        _host_pool = HostClientPool(itertools.cycle(random.choices(settings.USER_AGENTS, k=256)))
+    return _host_pool
+
+
+async def close_http_client() -> None:
+    global _host_pool
+    if _host_pool is not None:
+        await _host_pool.aclose()
+    _host_pool = None
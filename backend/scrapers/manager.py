@@ -6,16 +6,16 @@ Orchestrates all scrapers, runs them concurrently, stores results.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config import settings
 from database import AsyncSessionLocal, Finding, ScanTask, ThreatReport
 from scrapers.base import BaseScraper, ScraperResult
+from utils import json, scan_events
 
 # Import all scraper classes
 from scrapers.social import (
@@ -48,39 +48,92 @@ from scrapers.forums import (
 
 logger = logging.getLogger("kashf.scrapers.manager")
 
+# Live progress (0–100) of scans still running in this process. The database
+# only records the running (0) and completed (100) states.
+PROGRESS: dict[str, int] = {}
 
-def _all_scrapers() -> list[BaseScraper]:
-    """Instantiate one of every scraper."""
-    return [
-        # Social (6)
-        FacebookScraper(),
-        InstagramScraper(),
-        TwitterScraper(),
-        TikTokScraper(),
-        SnapchatScraper(),
-        PinterestScraper(),
-        # Professional (4)
-        LinkedInScraper(),
-        GitHubScraper(),
-        GitLabScraper(),
-        BehanceScraper(),
-        # Breach DBs (2)
-        HIBPScraper(),
-        DehashedScraper(),
-        # Public Records (4)
-        ShodanScraper(),
-        GravatarScraper(),
-        KeybaseScraper(),
-        AboutMeScraper(),
-        # Forums (4)
-        RedditScraper(),
-        StackOverflowScraper(),
-        MediumScraper(),
-        HackerNewsScraper(),
-    ]
+# Findings are inserted in batches of this many finished scrapers
+_FLUSH_EVERY = 5
+
+
+# One instance of every scraper, shared by all scans — they hold no
+# per-scan state and all use the shared HTTP client
+_SCRAPERS: tuple[BaseScraper, ...] = (
+    # Social (6)
+    FacebookScraper(),
+    InstagramScraper(),
+    TwitterScraper(),
+    TikTokScraper(),
+    SnapchatScraper(),
+    PinterestScraper(),
+    # Professional (4)
+    LinkedInScraper(),
+    GitHubScraper(),
+    GitLabScraper(),
+    BehanceScraper(),
+    # Breach DBs (2)
+    HIBPScraper(),
+    DehashedScraper(),
+    # Public Records (4)
+    ShodanScraper(),
+    GravatarScraper(),
+    KeybaseScraper(),
+    AboutMeScraper(),
+    # Forums (4)
+    RedditScraper(),
+    StackOverflowScraper(),
+    MediumScraper(),
+    HackerNewsScraper(),
+)
+
+
+class AdmissionController:
+    """
+    Semaphore-like gate whose limit can be changed while tasks are waiting.
+    Shrinking never preempts in-flight work; it only holds back new entrants.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._lock = asyncio.Lock()
+        self._cond = asyncio.Condition(self._lock)
+        self._active = 0
+        self._cmax = limit
+
+    @property
+    def limit(self) -> int:
+        return self._cmax
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            while self._active >= self._cmax:
+                await self._cond.wait()
+            self._active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
 
+    async def set_limit(self, limit: int) -> None:
+        async with self._cond:
+            self._cmax = max(1, limit)
+            self._cond.notify_all()
 
-async def _run_single_scraper(
+    async def __aenter__(self) -> AdmissionController:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+
+def _is_throttled(result: ScraperResult) -> bool:
+    """Whether a result suggests the upstream is pushing back."""
+    error = (result.error or "").lower()
+    return "rate limit" in error or "timeout" in error
+
+
+async def run_single_scraper(
     scraper: BaseScraper,
     query: str,
     query_type: str,
@@ -88,7 +141,7 @@ async def _run_single_scraper(
     """Run a single scraper with a timeout guard."""
     try:
         return await asyncio.wait_for(
-            scraper.check(query, query_type),
+            scraper.cached_check(query, query_type),
             timeout=settings.SCRAPER_TIMEOUT,
         )
     except asyncio.TimeoutError:
@@ -107,96 +160,172 @@ async def _run_single_scraper(
             error=str(exc),
             risk_category=scraper.risk_category,
         )
-    finally:
-        await scraper.close()
 
 
 async def run_scan(task_id: str, query: str, query_type: str) -> None:
     """
-    Main background task: runs all scrapers concurrently, stores findings,
-    then generates the threat report.
+    Main background task: runs all scrapers concurrently, storing findings
+    as they arrive, then the threat report, and marks the task completed —
+    all through one database session.
     """
-    scrapers = _all_scrapers()
+    # Scrapers that can't handle this query type are "not found" without a task
+    scrapers = [s for s in _SCRAPERS if query_type in s.supported_query_types]
+    skipped = [s._not_found() for s in _SCRAPERS if query_type not in s.supported_query_types]
     total = len(scrapers)
 
-    # Mark task as running
-    async with AsyncSessionLocal() as session:
-        task = await session.get(ScanTask, task_id)
-        if task:
-            task.status = "running"
-            task.progress = 0
-            await session.commit()
-
     logger.info(f"[Scan {task_id[:8]}] Starting {total} scrapers for query={query!r}")
 
-    # Use a semaphore to limit concurrency
-    semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_SCRAPERS)
+    # Limit concurrency; halve it when upstreams throttle, creep back on success
+    max_concurrent = settings.MAX_CONCURRENT_SCRAPERS
+    admission = AdmissionController(max_concurrent)
 
-    async def _limited(scraper: BaseScraper) -> ScraperResult:
-        async with semaphore:
-            return await _run_single_scraper(scraper, query, query_type)
+    done = 0
 
-    # Run all scrapers concurrently
-    results: list[ScraperResult] = await asyncio.gather(
-        *[_limited(s) for s in scrapers],
-        return_exceptions=False,
-    )
+    async def _limited(scraper: BaseScraper) -> ScraperResult:
+        # Never raises: run_single_scraper turns scraper failures into error
+        # results, and bookkeeping failures are only logged, so one platform
+        # can't take its siblings down with it
+        nonlocal done
+        async with admission:
+            result = await run_single_scraper(scraper, query, query_type)
+        done += 1
+        try:
+            if _is_throttled(result):
+                await admission.set_limit(admission.limit // 2)
+            elif admission.limit < max_concurrent:
+                await admission.set_limit(admission.limit + 1)
+            # Push live progress to any client streaming this task
+            progress = int((done / total) * 100)
+            scan_events.publish(task_id, {
+                "status": "running",
+                "progress": progress,
+                "platform": result.platform,
+                "found": result.found,
+            })
+            PROGRESS[task_id] = progress
+        except Exception as exc:
+            logger.error(f"[Scan {task_id[:8]}] progress update failed: {exc}")
+        return result
 
-    # Store findings in DB
-    async with AsyncSessionLocal() as session:
-        for i, result in enumerate(results):
-            data_payload: dict = result.data.copy() if result.data else {}
-            if result.error:
-                data_payload["_error"] = result.error
-            finding = Finding(
-                task_id=task_id,
-                platform=result.platform,
-                url=result.url,
-                found=1 if result.found else 0,
-                data_found=json.dumps(data_payload) if data_payload else None,
-                risk_category=result.risk_category,
-                risk_score=result.risk_score,
-            )
-            session.add(finding)
-
-            # Update progress
-            progress = int(((i + 1) / total) * 100)
-            task = await session.get(ScanTask, task_id)
-            if task:
-                task.progress = progress
-
-        await session.commit()
-
-    # Generate threat report
-    logger.info(f"[Scan {task_id[:8]}] All scrapers done. Generating threat report…")
-    await _generate_threat_report(task_id, results)
-
-    # Mark task as completed
-    async with AsyncSessionLocal() as session:
-        task = await session.get(ScanTask, task_id)
-        if task:
-            task.status = "completed"
-            task.progress = 100
-            task.completed_at = datetime.now(timezone.utc)
+    # One session for the whole scan, committed at each batch boundary (the
+    # connection goes back to the pool in between). Findings are written in
+    # small batches as scrapers finish, hiding the DB work behind slow platforms.
+    PROGRESS[task_id] = 0
+    completed = False
+    try:
+        async with AsyncSessionLocal() as session:
+            # Mark task as running
+            await _set_progress(session, task_id, 0, status="running")
             await session.commit()
 
+            try:
+                # The group cancels any scrapers still running if we bail out
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(_limited(s)) for s in scrapers]
+                    pending: list[ScraperResult] = []
+                    for next_done in asyncio.as_completed(tasks):
+                        pending.append(await next_done)
+                        if len(pending) >= _FLUSH_EVERY:
+                            await _bulk_insert_findings(session, task_id, pending)
+                            await session.commit()
+                            pending = []
+
+                logger.info(f"[Scan {task_id[:8]}] All scrapers done. Generating threat report…")
+                # Report over every result, skipped scrapers included; it is
+                # scored in a thread while the last findings are inserted (only
+                # the insert touches the session)
+                results = [t.result() for t in tasks] + skipped
+                _, report = await asyncio.gather(
+                    _bulk_insert_findings(session, task_id, pending + skipped),
+                    asyncio.to_thread(_build_threat_report, task_id, results),
+                )
+                session.add(report)
+                completed = await _set_progress(
+                    session, task_id, 100, status="completed", completed_at=func.now()
+                )
+                if completed:
+                    await session.commit()
+            except* IntegrityError:  # wiped while the scrapers were running
+                pass
+
+            if not completed:
+                await session.rollback()
+    finally:
+        progress = PROGRESS.pop(task_id, 0)
+        if not completed:
+            # Wiped or crashed — record the failure if the task is still
+            # there, and release any clients streaming the scan
+            await _mark_failed(task_id, progress)
+            scan_events.publish(task_id, {"status": "failed", "progress": progress})
+
+    if not completed:
+        logger.warning(f"[Scan {task_id[:8]}] Task disappeared — discarding results")
+        return
+
+    scan_events.publish(task_id, {"status": "completed", "progress": 100})
     logger.info(f"[Scan {task_id[:8]}] ✅ Scan completed")
 
 
-async def _generate_threat_report(task_id: str, results: list[ScraperResult]) -> None:
-    """Generate and store a ThreatReport based on all scraper results."""
+async def _set_progress(session: AsyncSession, task_id: str, progress: int, **values) -> bool:
+    """
+    One UPDATE for the task's progress (plus any other columns given).
+    Returns False if the task no longer exists.
+    """
+    result = await session.execute(
+        update(ScanTask).where(ScanTask.id == task_id).values(progress=progress, **values)
+    )
+    return result.rowcount > 0
+
+
+async def _mark_failed(task_id: str, progress: int) -> None:
+    """Persist a failed status so later polls and streams stop waiting on it."""
+    try:
+        async with AsyncSessionLocal() as session, session.begin():
+            await _set_progress(session, task_id, progress, status="failed")
+    except Exception as exc:
+        logger.error(f"[Scan {task_id[:8]}] could not mark task failed: {exc}")
+
+
+def _data_payload(result: ScraperResult) -> dict | None:
+    """Scraped data plus any error, as stored in Finding.data_found."""
+    data_payload: dict = result.data.copy() if result.data else {}
+    if result.error:
+        data_payload["_error"] = result.error
+    return data_payload or None
+
+
+async def _bulk_insert_findings(
+    session: AsyncSession, task_id: str, results: list[ScraperResult]
+) -> None:
+    """Store one Finding row per scraper result in a single executemany."""
+    if not results:
+        return
+    rows = [
+        {
+            "task_id": task_id,
+            "platform": result.platform,
+            "url": result.url,
+            "found": 1 if result.found else 0,
+            "data_found": _data_payload(result),
+            "risk_category": result.risk_category,
+            "risk_score": result.risk_score,
+        }
+        for result in results
+    ]
+    await session.execute(insert(Finding), rows)
+
+
+def _build_threat_report(task_id: str, results: list[ScraperResult]) -> ThreatReport:
+    """Score all scraper results into a (not yet persisted) ThreatReport."""
     from ai.threat_scorer import analyze_findings
 
     report_data = analyze_findings(results)
 
-    async with AsyncSessionLocal() as session:
-        report = ThreatReport(
-            task_id=task_id,
-            overall_score=report_data["overall_score"],
-            risk_level=report_data["risk_level"],
-            summary=json.dumps(report_data["summary"]),
-            recommendations=json.dumps(report_data["recommendations"]),
-            category_scores=json.dumps(report_data["category_scores"]),
-        )
-        session.add(report)
-        await session.commit()
+    return ThreatReport(
+        task_id=task_id,
+        overall_score=report_data["overall_score"],
+        risk_level=report_data["risk_level"],
+        summary=json.dumps(report_data["summary"]),
+        recommendations=json.dumps(report_data["recommendations"]),
+        category_scores=json.dumps(report_data["category_scores"]),
+    )
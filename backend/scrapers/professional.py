@@ -5,7 +5,8 @@ Covers: LinkedIn, GitHub, GitLab, Behance.
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+import re
+from urllib.parse import quote
 
 from scrapers.base import BaseScraper, ScraperResult
 
@@ -17,23 +18,22 @@ class LinkedInScraper(BaseScraper):
     platform_name = "LinkedIn"
     base_url = "https://www.linkedin.com/in"
     risk_category = "PHISHING"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"page-not-found", re.IGNORECASE)
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/{query}"
-        resp = await self._http_get(url)
+        url = self._url(f"/{quote(query, safe='@')}")
+        resp = await self._http_get_head_section(url)
         if resp is None:
             return self._error("Request failed")
         if self._is_auth_wall(resp):
             return self._error("LinkedIn authwall — profile verification requires authentication")
-        if resp.status_code == 200 and "page-not-found" not in resp.text.lower():
-            soup = BeautifulSoup(resp.text, "lxml")
-            title = soup.find("title")
-            name = title.get_text(strip=True).replace(" | LinkedIn", "") if title else query
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            headline = meta_desc["content"] if meta_desc and meta_desc.get("content") else ""
+        if resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            title = tree.css_first("title")
+            name = title.text(strip=True).replace(" | LinkedIn", "") if title else query
+            meta_desc = tree.css_first('meta[name="description"]')
+            headline = (meta_desc.attributes.get("content") if meta_desc else None) or ""
             return self._ok(url, {
                 "username": query,
                 "name": name,
@@ -54,24 +54,21 @@ class GitHubScraper(BaseScraper):
         # GitHub API supports searching by username; for email we search events
         if query_type == "email":
             # Search commits for the email
-            search_url = f"https://api.github.com/search/users?q={query}+in:email"
-            resp = await self._http_get(search_url)
-            if resp and resp.status_code == 200:
-                data = resp.json()
-                if data.get("total_count", 0) > 0:
-                    user = data["items"][0]
-                    profile_url = user.get("html_url", "")
-                    return self._ok(profile_url, {
-                        "username": user.get("login", ""),
-                        "avatar": user.get("avatar_url", ""),
-                    })
+            search_url = "https://api.github.com/search/users"
+            data = await self._get_json(search_url, params={"q": f"{query} in:email"})
+            if data and data.get("total_count", 0) > 0:
+                user = data["items"][0]
+                profile_url = user.get("html_url", "")
+                return self._ok(profile_url, {
+                    "username": user.get("login", ""),
+                    "avatar": user.get("avatar_url", ""),
+                })
             return self._not_found()
 
         # Username lookup
-        url = f"{self.base_url}/{query}"
-        resp = await self._http_get(url)
-        if resp and resp.status_code == 200:
-            data = resp.json()
+        url = self._url(f"/{quote(query, safe='@')}")
+        data = await self._get_json(url)
+        if data:
             profile_url = data.get("html_url", f"https://github.com/{query}")
             return self._ok(profile_url, {
                 "username": data.get("login", query),
@@ -95,24 +92,20 @@ class GitLabScraper(BaseScraper):
     platform_name = "GitLab"
     base_url = "https://gitlab.com"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        api_url = f"{self.base_url}/api/v4/users?username={query}"
-        resp = await self._http_get(api_url)
-        if resp and resp.status_code == 200:
-            users = resp.json()
-            if users and len(users) > 0:
-                user = users[0]
-                profile_url = user.get("web_url", f"{self.base_url}/{query}")
-                return self._ok(profile_url, {
-                    "username": user.get("username", query),
-                    "name": user.get("name", ""),
-                    "avatar": user.get("avatar_url", ""),
-                    "state": user.get("state", ""),
-                })
+        api_url = f"{self.base_url}/api/v4/users"
+        users = await self._get_json(api_url, params={"username": query})
+        if users:
+            user = users[0]
+            profile_url = user.get("web_url", f"{self.base_url}/{query}")
+            return self._ok(profile_url, {
+                "username": user.get("username", query),
+                "name": user.get("name", ""),
+                "avatar": user.get("avatar_url", ""),
+                "state": user.get("state", ""),
+            })
         return self._not_found()
 
 
@@ -123,16 +116,15 @@ class BehanceScraper(BaseScraper):
     platform_name = "Behance"
     base_url = "https://www.behance.net"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"Page Not Found")
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/{query}"
+        url = self._url(f"/{quote(query, safe='@')}")
         resp = await self._http_get(url)
-        if resp and resp.status_code == 200 and "Page Not Found" not in resp.text:
-            soup = BeautifulSoup(resp.text, "lxml")
-            title = soup.find("title")
-            name = title.get_text(strip=True) if title else query
+        if resp and resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            title = tree.css_first("title")
+            name = title.text(strip=True) if title else query
             return self._ok(url, {"username": query, "display_name": name})
         return self._not_found()
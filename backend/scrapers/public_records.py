@@ -7,13 +7,28 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import re
+from urllib.parse import quote
 
 from config import settings
 from scrapers.base import BaseScraper, ScraperResult
+from utils import json
 
 logger = logging.getLogger("kashf.scrapers.public_records")
 
 
+# Webmail domains — a Shodan hostname search on these says nothing about the user
+_COMMON_EMAIL_PROVIDERS: frozenset[str] = frozenset({
+    "gmail.com",
+    "yahoo.com",
+    "hotmail.com",
+    "outlook.com",
+    "icloud.com",
+    "proton.me",
+    "aol.com",
+})
+
+
 # ── Shodan ────────────────────────────────────────────────────────────
 
 
@@ -37,18 +52,18 @@ class ShodanScraper(BaseScraper):
         if query_type == "email":
             # Extract domain from email and search Shodan
             domain = query.split("@")[-1] if "@" in query else None
-            if not domain or domain in ("gmail.com", "yahoo.com", "hotmail.com", "outlook.com"):
+            if not domain or domain.lower() in _COMMON_EMAIL_PROVIDERS:
                 return self._not_found()  # Skip common providers
             search_query = f"hostname:{domain}"
         else:
             search_query = query
 
-        url = f"{self.base_url}/shodan/host/search"
+        url = self._url("/shodan/host/search")
         params = {"key": api_key, "query": search_query, "page": 1}
 
         resp = await self._http_get(url, params=params)
         if resp and resp.status_code == 200:
-            data = resp.json()
+            data = json.loads(resp.content)
             total = data.get("total", 0)
             if total > 0:
                 matches = data.get("matches", [])[:5]  # Top 5 results
@@ -84,17 +99,15 @@ class GravatarScraper(BaseScraper):
     platform_name = "Gravatar"
     base_url = "https://www.gravatar.com"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"email"})
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type != "email":
-            return self._not_found()
-
-        email_hash = hashlib.md5(query.strip().lower().encode()).hexdigest()
-        profile_url = f"{self.base_url}/{email_hash}.json"
+        email_hash = _gravatar_hash(query)
+        profile_url = self._url(f"/{email_hash}.json")
 
         resp = await self._http_get(profile_url)
         if resp and resp.status_code == 200:
-            data = resp.json()
+            data = json.loads(resp.content)
             entry = data.get("entry", [{}])[0] if data.get("entry") else {}
             return self._ok(
                 url=f"{self.base_url}/{email_hash}",
@@ -113,6 +126,11 @@ class GravatarScraper(BaseScraper):
         return self._not_found()
 
 
+def _gravatar_hash(email: str) -> str:
+    """Gravatar's profile key: MD5 of the trimmed, lowercased address."""
+    return hashlib.md5(email.strip().lower().encode(), usedforsecurity=False).hexdigest()
+
+
 # ── Keybase ───────────────────────────────────────────────────────────
 
 
@@ -124,15 +142,13 @@ class KeybaseScraper(BaseScraper):
     platform_name = "Keybase"
     base_url = "https://keybase.io"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})  # no public email search
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()  # Keybase doesn't expose email search publicly
-
-        api_url = f"{self.base_url}/_/api/1.0/user/lookup.json?usernames={query}"
-        resp = await self._http_get(api_url)
+        api_url = f"{self.base_url}/_/api/1.0/user/lookup.json"
+        resp = await self._http_get(api_url, params={"usernames": query})
         if resp and resp.status_code == 200:
-            data = resp.json()
+            data = json.loads(resp.content)
             them = data.get("them", [])
             if them and them[0] is not None:
                 user = them[0]
@@ -164,18 +180,15 @@ class AboutMeScraper(BaseScraper):
     platform_name = "About.me"
     base_url = "https://about.me"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"page not found", re.IGNORECASE)
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/{query}"
+        url = self._url(f"/{quote(query, safe='@')}")
         resp = await self._http_get(url)
-        if resp and resp.status_code == 200 and "page not found" not in resp.text.lower():
-            from bs4 import BeautifulSoup
-
-            soup = BeautifulSoup(resp.text, "lxml")
-            title = soup.find("title")
-            name = title.get_text(strip=True) if title else query
+        if resp and resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            title = tree.css_first("title")
+            name = title.text(strip=True) if title else query
             return self._ok(url, {"username": query, "display_name": name})
         return self._not_found()
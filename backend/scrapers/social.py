@@ -5,10 +5,14 @@ Covers: Facebook, Instagram, Twitter/X, TikTok, Snapchat, Pinterest.
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+import re
+from urllib.parse import quote
 
 from scrapers.base import BaseScraper, ScraperResult
 
+# TikTok's challenge page, checked near the top of the body
+_BOT_CHECK_RE = re.compile(rb"captcha|verify", re.IGNORECASE)
+
 
 # ── Facebook ──────────────────────────────────────────────────────────
 
@@ -17,21 +21,20 @@ class FacebookScraper(BaseScraper):
     platform_name = "Facebook"
     base_url = "https://www.facebook.com"
     risk_category = "IMPERSONATION"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"page not found", re.IGNORECASE)
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/{query}"
+        url = self._url(f"/{quote(query, safe='@')}")
         resp = await self._http_get(url)
         if resp is None:
             return self._error("Request failed")
         if self._is_auth_wall(resp):
             return self._error("Login wall — Facebook profile requires authentication")
-        if resp.status_code == 200 and "page not found" not in resp.text.lower():
-            soup = BeautifulSoup(resp.text, "lxml")
-            title = soup.find("title")
-            name = title.get_text(strip=True) if title else query
+        if resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            title = tree.css_first("title")
+            name = title.text(strip=True) if title else query
             return self._ok(url, {"name": name, "username": query})
         return self._not_found()
 
@@ -43,25 +46,24 @@ class InstagramScraper(BaseScraper):
     platform_name = "Instagram"
     base_url = "https://www.instagram.com"
     risk_category = "STALKING"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"Page Not Found")
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/{query}/"
-        resp = await self._http_get(url)
+        url = self._url(f"/{quote(query, safe='@')}/")
+        resp = await self._http_get_profile(url)
         if resp is None:
             return self._error("Request failed")
         if resp.status_code == 404:
             return self._not_found()
         if self._is_auth_wall(resp):
             return self._error("Login wall — Instagram profile verification requires authentication")
-        if resp.status_code == 200 and "Page Not Found" not in resp.text:
-            soup = BeautifulSoup(resp.text, "lxml")
-            og_image = soup.find("meta", attrs={"property": "og:image"})
-            meta_desc = soup.find("meta", attrs={"property": "og:description"})
+        if resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            og_image = tree.css_first('meta[property="og:image"]')
+            meta_desc = tree.css_first('meta[property="og:description"]')
             if og_image or meta_desc:
-                description = meta_desc["content"] if meta_desc and meta_desc.get("content") else ""
+                description = (meta_desc.attributes.get("content") if meta_desc else None) or ""
                 return self._ok(url, {"username": query, "bio_preview": description})
             return self._error("Bot protection — JavaScript rendering required")
         return self._not_found()
@@ -74,21 +76,20 @@ class TwitterScraper(BaseScraper):
     platform_name = "Twitter/X"
     base_url = "https://x.com"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"This account doesn")
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/{query}"
-        resp = await self._http_get(url)
+        url = self._url(f"/{quote(query, safe='@')}")
+        resp = await self._http_get_profile(url)
         if resp is None:
             return self._error("Request failed")
         if self._is_auth_wall(resp):
             return self._error("Login wall — Twitter/X profile verification requires authentication")
-        if resp.status_code == 200 and "This account doesn" not in resp.text:
-            soup = BeautifulSoup(resp.text, "lxml")
-            title = soup.find("title")
-            display = title.get_text(strip=True) if title else ""
+        if resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            title = tree.css_first("title")
+            display = title.text(strip=True) if title else ""
             # Generic page title means we got the JS shell, not real profile data
             if display.lower() not in ("x", "twitter", "twitter / x", "x / twitter", ""):
                 return self._ok(url, {"username": query, "display_name": display})
@@ -103,24 +104,22 @@ class TikTokScraper(BaseScraper):
     platform_name = "TikTok"
     base_url = "https://www.tiktok.com"
     risk_category = "STALKING"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"Couldn't find this account")
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/@{query}"
+        url = self._url(f"/@{quote(query, safe='@')}")
         resp = await self._http_get(url)
         if resp is None:
             return self._error("Request failed")
         if self._is_auth_wall(resp):
             return self._error("Bot protection detected — TikTok blocks automated checks")
-        sample = resp.text[:3000].lower()
-        if "captcha" in sample or "verify" in sample:
+        if _BOT_CHECK_RE.search(resp.content, 0, 3000):
             return self._error("Bot protection detected — TikTok requires CAPTCHA verification")
-        if resp.status_code == 200 and "Couldn't find this account" not in resp.text:
-            soup = BeautifulSoup(resp.text, "lxml")
-            title = soup.find("title")
-            name = title.get_text(strip=True) if title else ""
+        if resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            title = tree.css_first("title")
+            name = title.text(strip=True) if title else ""
             if name.lower() not in ("tiktok", ""):
                 return self._ok(url, {"username": query, "display_name": name})
         return self._not_found()
@@ -133,25 +132,24 @@ class SnapchatScraper(BaseScraper):
     platform_name = "Snapchat"
     base_url = "https://www.snapchat.com/add"
     risk_category = "STALKING"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"add_web_not_found", re.IGNORECASE)
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
         # story.snapchat.com serves SEO-friendly profile pages
-        story_url = f"https://story.snapchat.com/@{query}"
+        story_url = f"https://story.snapchat.com/@{quote(query, safe='@')}"
         resp = await self._http_get(story_url)
         if resp and resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, "lxml")
-            og_title = soup.find("meta", attrs={"property": "og:title"})
-            title_text = og_title.get("content", "") if og_title else ""
+            tree = await self._parse_html(resp)
+            og_title = tree.css_first('meta[property="og:title"]')
+            title_text = (og_title.attributes.get("content") if og_title else None) or ""
             if title_text and "page not found" not in title_text.lower():
                 return self._ok(story_url, {"username": query, "display_name": title_text})
 
         # Fallback: add page
-        add_url = f"https://www.snapchat.com/add/{query}"
+        add_url = self._url(f"/{quote(query, safe='@')}")
         resp2 = await self._http_get(add_url)
-        if resp2 and resp2.status_code == 200 and "add_web_not_found" not in resp2.text.lower():
+        if resp2 and resp2.status_code == 200 and not self._shows_not_found(resp2):
             return self._ok(add_url, {"username": query})
         return self._not_found()
 
@@ -163,20 +161,19 @@ class PinterestScraper(BaseScraper):
     platform_name = "Pinterest"
     base_url = "https://www.pinterest.com"
     risk_category = "REPUTATIONAL"
+    supported_query_types = frozenset({"username"})
+    _NOT_FOUND_RE = re.compile(rb"Sorry, that page")
 
     async def check(self, query: str, query_type: str) -> ScraperResult:
-        if query_type == "email":
-            return self._not_found()
-
-        url = f"{self.base_url}/{query}/"
+        url = self._url(f"/{quote(query, safe='@')}/")
         resp = await self._http_get(url)
         if resp is None:
             return self._error("Request failed")
         if self._is_auth_wall(resp):
             return self._error("Login wall — Pinterest profile requires authentication")
-        if resp.status_code == 200 and "Sorry, that page" not in resp.text:
-            soup = BeautifulSoup(resp.text, "lxml")
-            title = soup.find("title")
-            name = title.get_text(strip=True) if title else query
+        if resp.status_code == 200 and not self._shows_not_found(resp):
+            tree = await self._parse_html(resp)
+            title = tree.css_first("title")
+            name = title.text(strip=True) if title else query
             return self._ok(url, {"username": query, "display_name": name})
         return self._not_found()
@@ -0,0 +1,14 @@
+"""
+Kashf Backend — Test Setup
+Puts backend/ on sys.path, so the suite runs from the repo root as well as
+from backend/.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_BACKEND = str(Path(__file__).resolve().parent.parent)
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
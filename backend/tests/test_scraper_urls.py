@@ -0,0 +1,61 @@
+"""
+Kashf Backend — Scraper URL Tests
+Queries are user input, so characters like `/`, `?`, `#`, `&` and `+` must
+reach the platform percent-encoded rather than reshaping the URL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from scrapers.breach import HIBPScraper
+from scrapers.forums import RedditScraper
+from scrapers.professional import GitHubScraper, GitLabScraper
+from scrapers.public_records import KeybaseScraper
+from scrapers.social import SnapchatScraper, TwitterScraper
+
+
+def _requested_urls(scraper, query: str, query_type: str) -> list[httpx.URL]:
+    """Run `check()` and return the URLs it tried to fetch (without any network)."""
+    requested: list[httpx.URL] = []
+
+    async def fake_get(url, **kwargs):
+        requested.append(httpx.URL(url).copy_merge_params(kwargs.get("params") or {}))
+        return None
+
+    scraper._http_get = scraper._http_head = scraper._http_get_head_section = fake_get
+    asyncio.run(scraper.check(query, query_type))
+    return requested
+
+
+@pytest.mark.parametrize(
+    ("scraper", "query", "query_type", "expected_paths"),
+    [
+        (HIBPScraper("key"), "a?b#c@example.com", "email", [b"/api/v3/breachedaccount/a%3Fb%23c@example.com"]),
+        (TwitterScraper(), "who?#", "username", [b"/who%3F%23"]),
+        (RedditScraper(), "../admin", "username", [b"/user/..%2Fadmin/about.json"]),
+        (SnapchatScraper(), "a/b?c#d", "username", [b"/@a%2Fb%3Fc%23d", b"/add/a%2Fb%3Fc%23d"]),
+    ],
+)
+def test_query_is_percent_encoded(scraper, query, query_type, expected_paths):
+    urls = _requested_urls(scraper, query, query_type)
+    # Profile fetches may send a HEAD before the GET — same URL both times
+    assert {url.raw_path.partition(b"?")[0] for url in urls} == set(expected_paths)
+    assert all(url.fragment == "" for url in urls)
+
+
+@pytest.mark.parametrize(
+    ("scraper", "query", "query_type", "param", "expected"),
+    [
+        (GitHubScraper(), "a+b&per_page=1#@x.com", "email", "q", "a+b&per_page=1#@x.com in:email"),
+        (GitLabScraper(), "bob&admin=true#", "username", "username", "bob&admin=true#"),
+        (KeybaseScraper(), "bob&fields=all#", "username", "usernames", "bob&fields=all#"),
+    ],
+)
+def test_query_string_lookups_keep_the_query_whole(scraper, query, query_type, param, expected):
+    (url,) = _requested_urls(scraper, query, query_type)
+    assert dict(url.params) == {param: expected}
+    assert url.fragment == ""
@@ -5,7 +5,9 @@ Pre-built templates used as a fallback when no local LLM is available.
 
 from __future__ import annotations
 
+import string
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
 
@@ -33,46 +35,32 @@ PLATFORM_CONTACTS: dict[str, str] = {
     "HackerNews": "hn@ycombinator.com",
 }
 
+# Characters dropped when deriving a domain from a platform name
+_PLATFORM_SANITIZE = str.maketrans("", "", " /")
 
-def get_takedown_email(
-    platform: str,
-    user_name: str,
-    user_email: str,
-    findings: dict[str, Any] | None = None,
-) -> dict[str, str]:
-    """
-    Generate a template-based GDPR/CCPA data deletion request email.
 
-    Returns:
-        dict with keys: email_subject, email_body, recipient_hint
-    """
-    today = datetime.now(timezone.utc).strftime("%B %d, %Y")
-    recipient = PLATFORM_CONTACTS.get(platform, f"privacy@{platform.lower().replace(' ', '').replace('/', '')}.com")
+def default_privacy_contact(platform: str) -> str:
+    """Best-guess privacy address for platforms without a known contact."""
+    return f"privacy@{platform.lower().translate(_PLATFORM_SANITIZE)}.com"
 
-    # Build data description from findings
-    data_description = ""
-    if findings:
-        data_items = [f"  • {k}: {v}" for k, v in findings.items() if v and k not in ("source",)]
-        if data_items:
-            data_description = (
-                "\n\nSpecifically, I have identified the following personal data "
-                f"held by {platform}:\n" + "\n".join(data_items)
-            )
-
-    subject = (
-        f"Data Deletion Request Under GDPR Article 17 & CCPA §1798.105 — "
-        f"{platform} Account"
-    )
 
-    body = f"""Dear {platform} Data Protection / Privacy Team,
+def _subject(platform: str) -> str:
+    return f"Data Deletion Request Under GDPR Article 17 & CCPA §1798.105 — {platform} Account"
+
+
+# ── Templates ─────────────────────────────────────────────────────────
+# Parsed once at import; each request only substitutes its own fields
+_SUBJECTS: dict[str, str] = {p: _subject(p) for p in PLATFORM_CONTACTS}
+
+_BODY_TEMPLATE = string.Template("""Dear ${platform} Data Protection / Privacy Team,
 
 I am writing to exercise my rights under the European Union General Data Protection Regulation (GDPR), specifically Article 17 ("Right to Erasure"), and the California Consumer Privacy Act (CCPA), §1798.105, to request the complete deletion of my personal data from your platform and all associated systems.
 
 **Data Subject Information:**
-- Full Name: {user_name}
-- Email Address: {user_email}
-- Platform: {platform}
-- Date of Request: {today}{data_description}
+- Full Name: ${user_name}
+- Email Address: ${user_email}
+- Platform: ${platform}
+- Date of Request: ${today}${data_description}
 
 **Request:**
 
@@ -101,8 +89,50 @@ I look forward to your confirmation of deletion.
 
 Sincerely,
 
-{user_name}
-{user_email}"""
+${user_name}
+${user_email}""")
+
+
+@lru_cache(maxsize=64)
+def _platform_template(platform: str, today: str) -> string.Template:
+    """
+    The body template with only the non-personal fields (platform, date)
+    filled in — the user's details are substituted fresh on every call.
+    """
+    return string.Template(
+        _BODY_TEMPLATE.safe_substitute(platform=platform.replace("$", "$$"), today=today)
+    )
+
+
+def get_takedown_email(
+    platform: str,
+    user_name: str,
+    user_email: str,
+    findings: dict[str, Any] | None = None,
+) -> dict[str, str]:
+    """
+    Generate a template-based GDPR/CCPA data deletion request email.
+
+    Returns:
+        dict with keys: email_subject, email_body, recipient_hint
+    """
+    today = datetime.now(timezone.utc).strftime("%B %d, %Y")
+    recipient = PLATFORM_CONTACTS.get(platform) or default_privacy_contact(platform)
+
+    # Build data description from findings
+    data_description = ""
+    if findings:
+        parts = [f"\n\nSpecifically, I have identified the following personal data held by {platform}:"]
+        parts.extend(f"  • {k}: {v}" for k, v in findings.items() if v and k != "source")
+        if len(parts) > 1:
+            data_description = "\n".join(parts)
+
+    subject = _SUBJECTS.get(platform) or _subject(platform)
+    body = _platform_template(platform, today).substitute(
+        user_name=user_name,
+        user_email=user_email,
+        data_description=data_description,
+    )
 
     return {
         "email_subject": subject,
@@ -0,0 +1,21 @@
+"""
+Kashf Backend — JSON Helpers
+orjson-backed drop-ins for json.dumps / json.loads.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def dumps(value: Any) -> str:
+    """Serialize to a JSON string (non-str dict keys are stringified)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def loads(value: str | bytes) -> Any:
+    return orjson.loads(value)
@@ -0,0 +1,38 @@
+"""
+Kashf Backend — Scan Event Bus
+In-process pub/sub that pushes scan progress to streaming clients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+logger = logging.getLogger("kashf.utils.scan_events")
+
+# task_id -> queues of the clients currently streaming that task
+_subscribers: dict[str, set[asyncio.Queue[dict[str, Any]]]] = {}
+
+
+def subscribe(task_id: str) -> asyncio.Queue[dict[str, Any]]:
+    """Register a listener for a task's events and return its queue."""
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    _subscribers.setdefault(task_id, set()).add(queue)
+    return queue
+
+
+def unsubscribe(task_id: str, queue: asyncio.Queue[dict[str, Any]]) -> None:
+    """Remove a listener; drops the task entry once nobody is listening."""
+    queues = _subscribers.get(task_id)
+    if queues is None:
+        return
+    queues.discard(queue)
+    if not queues:
+        del _subscribers[task_id]
+
+
+def publish(task_id: str, event: dict[str, Any]) -> None:
+    """Fan an event out to every listener of a task. No-op without listeners."""
+    for queue in _subscribers.get(task_id, ()):
+        queue.put_nowait(event)
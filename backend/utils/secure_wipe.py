@@ -5,15 +5,20 @@ Securely deletes scan data from the database.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 
-from database import AsyncSessionLocal, Finding, ScanTask, ThreatReport
+from database import AsyncSessionLocal, ScanTask
+from scrapers.base import clear_etag_cache, clear_result_cache, evict_cached_results
 
 logger = logging.getLogger("kashf.utils.secure_wipe")
 
+# Set whenever a scan is created, so an idle auto-wipe loop can reschedule
+_new_task = asyncio.Event()
+
 
 async def wipe_task_data(task_id: str) -> bool:
     """
@@ -22,26 +27,26 @@ async def wipe_task_data(task_id: str) -> bool:
 
     Returns True if data was found and deleted.
     """
-    async with AsyncSessionLocal() as session:
-        task = await session.get(ScanTask, task_id)
-        if not task:
-            logger.warning(f"[Wipe] Task {task_id} not found")
-            return False
-
-        # Delete in order: findings → threat_report → task
-        await session.execute(
-            delete(Finding).where(Finding.task_id == task_id)
-        )
-        await session.execute(
-            delete(ThreatReport).where(ThreatReport.task_id == task_id)
-        )
-        await session.execute(
-            delete(ScanTask).where(ScanTask.id == task_id)
-        )
-        await session.commit()
-
-        logger.info(f"[Wipe] ✅ All data for task {task_id[:8]}… securely deleted")
-        return True
+    # Findings and the threat report go with it via ON DELETE CASCADE
+    async with AsyncSessionLocal() as session, session.begin():
+        wiped = (
+            await session.execute(
+                delete(ScanTask)
+                .where(ScanTask.id == task_id)
+                .returning(ScanTask.query, ScanTask.query_type)
+            )
+        ).first()
+
+    if wiped is None:
+        logger.warning(f"[Wipe] Task {task_id} not found")
+        return False
+
+    # Cached scraper results for the target would outlive the wipe otherwise;
+    # API responses are cached by URL, not by task — drop them all
+    evict_cached_results(wiped.query, wiped.query_type)
+    clear_etag_cache()
+    logger.info(f"[Wipe] ✅ All data for task {task_id[:8]}… securely deleted")
+    return True
 
 
 async def wipe_expired_tasks(ttl_hours: int | None = None) -> int:
@@ -53,29 +58,48 @@ async def wipe_expired_tasks(ttl_hours: int | None = None) -> int:
 
     ttl = ttl_hours if ttl_hours is not None else settings.DATA_TTL_HOURS
     cutoff = datetime.now(timezone.utc) - timedelta(hours=ttl)
-    wiped_count = 0
-
-    async with AsyncSessionLocal() as session:
-        result = await session.execute(
-            select(ScanTask).where(ScanTask.created_at < cutoff)
-        )
-        expired_tasks = result.scalars().all()
-
-        for task in expired_tasks:
-            await session.execute(
-                delete(Finding).where(Finding.task_id == task.id)
-            )
-            await session.execute(
-                delete(ThreatReport).where(ThreatReport.task_id == task.id)
-            )
-            await session.execute(
-                delete(ScanTask).where(ScanTask.id == task.id)
-            )
-            wiped_count += 1
 
-        await session.commit()
+    # One set-based delete; children follow via ON DELETE CASCADE
+    async with AsyncSessionLocal() as session, session.begin():
+        result = await session.execute(delete(ScanTask).where(ScanTask.created_at < cutoff))
+        wiped_count = result.rowcount
 
     if wiped_count > 0:
+        clear_result_cache()
+        clear_etag_cache()
         logger.info(f"[Wipe] 🧹 Auto-wiped {wiped_count} expired task(s) older than {ttl}h")
 
     return wiped_count
+
+
+async def get_soonest_expiry(ttl_hours: int | None = None) -> datetime | None:
+    """
+    When the oldest stored task passes its TTL (UTC), or None if no tasks
+    are stored.
+    """
+    from config import settings
+
+    ttl = ttl_hours if ttl_hours is not None else settings.DATA_TTL_HOURS
+
+    async with AsyncSessionLocal() as session:
+        oldest = await session.scalar(select(func.min(ScanTask.created_at)))
+
+    if oldest is None:
+        return None
+    if oldest.tzinfo is None:  # stored as naive UTC
+        oldest = oldest.replace(tzinfo=timezone.utc)
+    return oldest + timedelta(hours=ttl)
+
+
+def notify_new_task() -> None:
+    """Tell the auto-wipe loop a new scan exists (and will need wiping)."""
+    _new_task.set()
+
+
+async def wait_for_new_task(timeout: float | None) -> None:
+    """Sleep until `timeout` elapses or a new scan is created, whichever first."""
+    try:
+        await asyncio.wait_for(_new_task.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    _new_task.clear()
@@ -1,4 +1,4 @@
-import { useState, useEffect, useRef } from "react";
+import { useState, useEffect } from "react";
 import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
 import ResultsDashboard from "@/components/ResultsDashboard";
@@ -54,7 +54,6 @@ export default function LandingPage() {
     const [progress, setProgress] = useState(0);
     const [scanResults, setScanResults] = useState(null);
     const [error, setError] = useState(null);
-    const pollRef = useRef(null);
 
     const queryType = query.includes("@") ? "email" : "username";
 
@@ -88,34 +87,42 @@ export default function LandingPage() {
     useEffect(() => {
         if (!taskId) return;
 
-        const poll = async () => {
-            try {
-                const res = await fetch(`${API_BASE}/results/${taskId}`);
-                if (!res.ok) return;
-                const data = await res.json();
-                setProgress(data.progress || 0);
-
-                if (data.status === "completed") {
-                    clearInterval(pollRef.current);
-                    setScanResults(data);
-                    setScanPhase("complete");
-                } else if (data.status === "failed") {
-                    clearInterval(pollRef.current);
-                    setError("Scan failed — please try again");
-                    setScanPhase("idle");
-                }
-            } catch {
-                // ignore transient polling errors
+        // The backend pushes progress as it happens, then one final result.
+        // EventSource reconnects on its own after transient network errors;
+        // the error handler only gives up once the server refuses the stream outright.
+        const source = new EventSource(`${API_BASE}/results/${taskId}/stream`);
+
+        source.addEventListener("progress", (e) => {
+            const data = JSON.parse(e.data);
+            setProgress(data.progress || 0);
+        });
+
+        source.addEventListener("result", (e) => {
+            source.close();
+            const data = JSON.parse(e.data);
+            if (data.status === "completed") {
+                setProgress(100);
+                setScanResults(data);
+                setScanPhase("complete");
+            } else {
+                setError("Scan failed — please try again");
+                setScanPhase("idle");
             }
-        };
+        });
+
+        source.addEventListener("error", () => {
+            // CONNECTING means a retry is under way; CLOSED means the scan
+            // is gone (e.g. wiped) and no result will ever arrive
+            if (source.readyState !== EventSource.CLOSED) return;
+            source.close();
+            setError("Scan is no longer available — please try again");
+            setScanPhase("idle");
+        });
 
-        pollRef.current = setInterval(poll, 2000);
-        poll(); // immediate first check
-        return () => clearInterval(pollRef.current);
+        return () => source.close();
     }, [taskId]);
 
     const handleNewScan = () => {
-        clearInterval(pollRef.current);
         setScanPhase("idle");
         setTaskId(null);
         setScanResults(null);